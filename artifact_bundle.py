@@ -0,0 +1,30 @@
+import io
+import zipfile
+
+# Zip based (or already gzipped) formats are stored as they are - deflating them again gains nothing
+STORED_SUFFIXES = ('.xlsx', '.pptx', '.csmsnap')
+
+
+def write_bundle(output, entries):
+    """
+    Write entries ([(name in the zip, callable returning the bytes or None)]) into a zip on
+    output one at a time, so only one artifact is loaded at once. Entries whose callable
+    returns None (e.g. evicted from the cache) are left out. Returns the names written
+    """
+    written = []
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, load in entries:
+            data = load()
+            if data is None:
+                continue
+            stored = name.lower().endswith(STORED_SUFFIXES)
+            zf.writestr(name, data, compress_type=zipfile.ZIP_STORED if stored else None)
+            written.append(name)
+    return written
+
+
+def bundle_bytes(entries):
+    """The zip of entries as bytes, for a deferred st.download_button"""
+    output = io.BytesIO()
+    write_bundle(output, entries)
+    return output.getvalue()
@@ -0,0 +1,117 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+# Generated reports are kept here instead of piling up in the working directory
+ARTIFACT_STORE_DIR = os.environ.get("CSM_ARTIFACT_DIR", "artifacts")
+ARTIFACT_MAX_AGE_SECONDS = float(os.environ.get("CSM_ARTIFACT_MAX_AGE_DAYS", 14)) * 24 * 3600
+ARTIFACT_MAX_BYTES = int(os.environ.get("CSM_ARTIFACT_MAX_BYTES", 1024 * 1024 * 1024))
+ARTIFACT_CLEANUP_INTERVAL = float(os.environ.get("CSM_ARTIFACT_CLEANUP_INTERVAL", 600))
+
+
+class ArtifactStore:
+    """
+    Content-addressed file store: identical outputs are stored once under their sha256,
+    sharded into two-character subdirectories, and old/oversized content is evicted
+    """
+
+    def __init__(self, root=None, max_age_seconds=None, max_bytes=None, cleanup_interval=None):
+        self.root = root or ARTIFACT_STORE_DIR
+        self.max_age_seconds = ARTIFACT_MAX_AGE_SECONDS if max_age_seconds is None else max_age_seconds
+        self.max_bytes = ARTIFACT_MAX_BYTES if max_bytes is None else max_bytes
+        self.cleanup_interval = ARTIFACT_CLEANUP_INTERVAL if cleanup_interval is None else cleanup_interval
+        self._cleanup_lock = threading.Lock()
+        self._last_cleanup = 0.0
+        os.makedirs(self.root, exist_ok=True)
+
+    def path_for(self, digest, suffix=""):
+        return os.path.join(self.root, digest[:2], f"{digest}{suffix}")
+
+    def path_for_data(self, data, suffix="", digest=None):
+        """Path data is (or will be) stored under"""
+        return self.path_for(digest or hashlib.sha256(data).hexdigest(), suffix)
+
+    def put_bytes(self, data, suffix="", digest=None):
+        """
+        Store data and return its path; identical content is written only once. digest
+        overrides the sha256 of data for content with per-run noise (e.g. a timestamp)
+        """
+        path = self.path_for_data(data, suffix, digest)
+        if os.path.exists(path):
+            # Refresh the timestamp so retention treats it as recently used
+            os.utime(path)
+            return path
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first so readers never see a partial artifact
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return path
+
+    def _entries(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, stat.st_mtime, stat.st_size
+
+    def cleanup(self, now=None):
+        """Remove artifacts older than max_age_seconds, then the oldest until under max_bytes"""
+        now = time.time() if now is None else now
+        removed, freed = 0, 0
+        kept = []
+        for path, mtime, size in self._entries():
+            if now - mtime > self.max_age_seconds:
+                try:
+                    os.remove(path)
+                    removed += 1
+                    freed += size
+                except FileNotFoundError:
+                    pass
+            else:
+                kept.append((mtime, path, size))
+
+        total = sum(size for _, _, size in kept)
+        for mtime, path, size in sorted(kept):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                removed += 1
+                freed += size
+            except FileNotFoundError:
+                pass
+            total -= size
+
+        return removed, freed
+
+    def schedule_cleanup(self, executor):
+        """Run cleanup on executor at most once per cleanup_interval; never blocks the caller"""
+        now = time.time()
+        if now - self._last_cleanup < self.cleanup_interval:
+            return None
+        if not self._cleanup_lock.acquire(blocking=False):
+            return None  # a cleanup is already running
+        self._last_cleanup = now
+
+        def run():
+            try:
+                removed, freed = self.cleanup()
+                if removed:
+                    print(f"Artifact store cleanup removed {removed} files ({freed} bytes)")
+            finally:
+                self._cleanup_lock.release()
+
+        return executor.submit(run)
@@ -0,0 +1,110 @@
+import argparse
+import glob
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from ppt_automation import generate_report_from_data, load_template
+from report_snapshot import read_snapshot
+
+PAYLOAD_PATTERNS = ("*.json", "*.csmsnap")
+
+
+def collect_payloads(inputs):
+    """Combined-data files from a list of files and/or directories (sorted, duplicates dropped)"""
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            for pattern in PAYLOAD_PATTERNS:
+                paths.extend(glob.glob(os.path.join(item, pattern)))
+        else:
+            paths.append(item)
+    return sorted(set(os.path.abspath(path) for path in paths))
+
+
+def output_path_for(payload_path, output_dir):
+    """Deck path for a payload - a short hash of the payload path keeps a/week.json and b/week.json apart"""
+    name = os.path.splitext(os.path.basename(payload_path))[0]
+    path_hash = hashlib.sha1(os.path.abspath(payload_path).encode("utf-8")).hexdigest()[:8]
+    return os.path.join(output_dir, f"{name}-{path_hash}.pptx")
+
+
+def render_payload(payload_path, template_path, output_dir):
+    """Render one deck; runs inside a worker process and never raises"""
+    started = time.perf_counter()
+    output_path = output_path_for(payload_path, output_dir)
+    try:
+        generate_report_from_data(template_path, output_path, read_snapshot(payload_path))
+        error = None
+    except Exception as e:
+        output_path, error = None, f"{type(e).__name__}: {e}"
+    return {
+        'payload': payload_path,
+        'output': output_path,
+        'seconds': time.perf_counter() - started,
+        'error': error,
+    }
+
+
+def generate_batch(payload_paths, template_path="template.pptx", output_dir="batch_reports", workers=None):
+    """
+    Render one deck per combined-data payload in a process pool. Every worker parses and
+    compiles the template once (pool initializer) and reuses it for all of its decks.
+    Returns one result dict per payload, in input order. A template that cannot be loaded
+    raises here, before any worker is started
+    """
+    template_path = os.path.abspath(template_path)
+    load_template(template_path)
+    os.makedirs(output_dir, exist_ok=True)
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=load_template, initargs=(template_path,)) as pool:
+        futures = {
+            pool.submit(render_payload, path, template_path, output_dir): path
+            for path in payload_paths
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. killed or out of memory) - report it as this deck's failure
+                result = {'payload': futures[future], 'output': None, 'seconds': 0.0, 'error': f"{type(e).__name__}: {e}"}
+            results[futures[future]] = result
+            status = "failed" if result['error'] else "done"
+            print(f"[{status}] {os.path.basename(result['payload'])} in {result['seconds']:.2f}s"
+                  + (f" - {result['error']}" if result['error'] else ""))
+    return [results[path] for path in payload_paths]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render weekly PowerPoint decks from combined report data files")
+    parser.add_argument("inputs", nargs="+", help="combined JSON / .csmsnap files or directories containing them")
+    parser.add_argument("--template", default="template.pptx", help="PowerPoint template (default: template.pptx)")
+    parser.add_argument("--output-dir", default="batch_reports", help="where the decks are written")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    payloads = collect_payloads(args.inputs)
+    if not payloads:
+        print("No combined report data files found")
+        return 1
+
+    try:
+        load_template(os.path.abspath(args.template))
+    except Exception as e:
+        print(f"Could not load template {args.template}: {e}")
+        return 1
+
+    started = time.perf_counter()
+    results = generate_batch(payloads, args.template, args.output_dir, args.workers)
+    failures = [r for r in results if r['error']]
+
+    print(f"\n{len(results) - len(failures)}/{len(results)} decks generated in {time.perf_counter() - started:.2f}s")
+    for result in failures:
+        print(f"FAILED {result['payload']}: {result['error']}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
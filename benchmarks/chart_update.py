@@ -0,0 +1,99 @@
+"""
+Chart update benchmark: chart.replace_data() (XML + embedded workbook) against the
+XML-only update_chart_data() path, per chart and for a whole weekly deck.
+
+    python -m benchmarks.chart_update --template template.pptx --repeat 20
+"""
+import argparse
+import io
+import json
+import statistics
+import time
+
+from pptx.chart.data import CategoryChartData
+
+from ppt_automation import generate_weekly_report, load_template
+from ppt_template import update_chart_data
+
+
+def _timed(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return {'median_ms': statistics.median(timings) * 1000, 'min_ms': min(timings) * 1000, 'runs': repeat}
+
+
+def sample_report_args(categories=8):
+    people = [f"Person {i}" for i in range(categories)]
+    accounts = [f"Account {i}" for i in range(categories)]
+    weeks = [f"Week {i}" for i in range(4)]
+    return dict(
+        report_date="19 September 2025",
+        new_period="09/01/2025 to 09/07/2025",
+        total_tasks=120,
+        completed_tasks=100,
+        ticket_status_data={"New": 5, "Inprogress": 10, "Awaiting": 5, "Closed": 100},
+        individual_data={name: i + 1 for i, name in enumerate(people)},
+        main_chart_data={name: i + 2 for i, name in enumerate(accounts)},
+        pie1_data={"SLA Met": 100, "SLA Lost": 0},
+        pie2_data={"Priority 1": 1, "Priority 2": 2, "Priority 3": 30, "Priority 4": 87},
+        new_date="09/07/2025",
+        slide5_data=None,
+        slide6_data={
+            'column_chart_data': {week: 100 + i for i, week in enumerate(weeks)},
+            'bar_chart_data': {week: {'awaiting': i, 'closed': 2 * i, 'resolved': 90 + i} for i, week in enumerate(weeks)},
+        },
+    )
+
+
+def run(template_path="template.pptx", repeat=20, categories=8):
+    prs, _ = load_template(template_path)
+    chart = next(shape.chart for shape in prs.slides[1].shapes if shape.has_chart)
+    chart_data = CategoryChartData()
+    chart_data.categories = [f"Category {i}" for i in range(categories)]
+    chart_data.add_series("Series", list(range(categories)))
+
+    args = sample_report_args(categories)
+
+    def build_deck(refresh_workbooks):
+        # Slide cache off - every iteration after the first would otherwise be a cache hit
+        # (benchmarks.suite times the cached path as incremental_unchanged)
+        generate_weekly_report(template_path, io.BytesIO(), refresh_workbooks=refresh_workbooks, incremental=False, **args)
+
+    results = {
+        'categories': categories,
+        'single_chart': {
+            'replace_data': _timed(lambda: chart.replace_data(chart_data), repeat),
+            'xml_cache_update': _timed(lambda: update_chart_data(chart, chart_data), repeat),
+        },
+        'weekly_deck': {
+            'replace_data': _timed(lambda: build_deck(True), repeat),
+            'xml_cache_update': _timed(lambda: build_deck(False), repeat),
+        },
+    }
+    for section in ('single_chart', 'weekly_deck'):
+        slow = results[section]['replace_data']['median_ms']
+        fast = results[section]['xml_cache_update']['median_ms']
+        results[section]['speedup'] = slow / fast if fast else None
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--template", default="template.pptx")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--categories", type=int, default=8)
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run(args.template, args.repeat, args.categories)
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
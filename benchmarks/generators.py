@@ -0,0 +1,150 @@
+"""
+Synthetic inputs shaped like the real uploads, from a handful to ~1M rows:
+
+- Cloud Services Report workbooks: report header with the B7 period line, status
+  sections (status only on a section's first row, B:C merged), Subtotal rows and a Total
+- DaaS queue exports: DATE cells merged over each day's block, free-text statuses with
+  the spacing/case variants seen in real files
+
+Both are written with xlsxwriter in constant_memory mode, so generating 1M rows needs
+little memory. Output is deterministic for a given seed.
+"""
+import random
+from datetime import datetime, timedelta
+
+import xlsxwriter
+
+# Excel's sheet limit, minus header rows
+MAX_ROWS = 1048576 - 20
+
+REPORT_STATUSES = [
+    ("New", 1), ("Inprogress", 3), ("Awaiting", 2),
+    ("Internal Solution Provided", 1), ("Resolved with Customer", 6), ("Closed", 4),
+]
+REPORT_PEOPLE = ["Abhijeet Nashikkar", "Aditya Anand", "Nishanth Senthilkumar", "Sakthivel s Venkatachalam"]
+REPORT_CONTACTS = ["Maciej Panek", "Shubham Katyal", "Abhishek Patil", "Nishanth Senthilkumar"]
+REPORT_SUBJECTS = [
+    "[Action may be Required] Amazon EC2 Maintenance: Instance scheduled for reboot",
+    "Snowflake AWS Keys",
+    "Request to Delete files for DaaS processing blob",
+    "Request to Create Azure VM for Automation Tasks",
+    "Request for File Transfer from INTG to PROD Location",
+    "Customer Added Communication: Chat: Site to Site VPN with Azure not working",
+]
+
+QUEUE_RESOURCES = ["Abhijeet", "Saptha", "Sakthivel", "Aditya", "Nishanth", "Hema"]
+QUEUE_COMMENTS = ["Dispatched to SRE Team", "Ticket Dispatched to HemaSanjay", "Ticket closed", "Waiting on customer"]
+# (status as typed in the export, weight)
+QUEUE_STATUSES = [
+    ("Resolved with Customer", 28), ("resolved with customer ", 2), ("Awaiting ", 3), ("Awaiting", 1),
+    ("Pending Problem Solution", 2), ("Pending Problem Solution ", 1), ("Ticket closed", 2), ("Closed", 1),
+    ("In Progress", 1), ("NEW", 1), ("Awaiting Approval", 1),
+]
+
+
+def _merge(worksheet, first_row, first_col, last_row, last_col, value, cell_format=None):
+    """
+    merge_range() for constant_memory sheets: merge_range() pads the area with blank cells,
+    which constant_memory drops for rows it has not reached yet (taking the row's data with
+    them), and tracks every merged cell - so only the value and the merge record are written
+    """
+    worksheet.write(first_row, first_col, value, cell_format)
+    worksheet.merge.append([first_row, first_col, last_row, last_col])
+
+
+def _split(total, weights, rng):
+    """total split into len(weights) parts proportional to weights (every part >= 1 when possible)"""
+    parts = [max(1, total * w // sum(weights)) if total >= len(weights) else 0 for w in weights]
+    while sum(parts) > total:
+        parts[parts.index(max(parts))] -= 1
+    while sum(parts) < total:
+        parts[rng.randrange(len(parts))] += 1
+    return parts
+
+
+def make_report_workbook(output, tickets, start_date=datetime(2025, 9, 1), seed=0):
+    """Write a 'Cloud Services Report' workbook with the given number of ticket rows to output (path or stream)"""
+    tickets = min(tickets, MAX_ROWS)
+    rng = random.Random(seed)
+    end_date = start_date + timedelta(days=6)
+
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+    ws = workbook.add_worksheet("Cloud Services Report")
+    bold = workbook.add_format({'bold': True})
+
+    ws.write(1, 1, "Cloud Services Report", bold)
+    ws.write(2, 1, f"As of {end_date + timedelta(days=2):%Y-%m-%d} 02:10:07 Pacific Standard Time/PST • Generated by Benchmark")
+    ws.write(5, 1, "Filtered By")
+    ws.write(6, 1, f"Date Field:  equals Custom ({start_date.month}/{start_date.day}/{start_date.year} "
+                   f"to {end_date.month}/{end_date.day}/{end_date.year})")
+    ws.write(7, 1, "Show: All cases")
+    ws.write(8, 1, "Units: Days")
+    ws.write(9, 1, "Asset Name equals Cloud Services")
+
+    _merge(ws, 11, 1, 11, 2, "Status  ↑", bold)
+    ws.write_row(11, 3, ["Case Number", "Case Responsible", "Contact Name", "Subject",
+                         "Date/Time Opened", "Age", "Priority", "Case Type", "Case Owner"], bold)
+
+    row = 12
+    case_number = 9850000
+    sections = _split(tickets, [w for _, w in REPORT_STATUSES], rng)
+    for (status, _), count in zip(REPORT_STATUSES, sections):
+        if not count:
+            continue
+        for i in range(count):
+            _merge(ws, row, 1, row, 2, status if i == 0 else None)
+            opened = start_date + timedelta(minutes=rng.randrange(7 * 24 * 60))
+            responsible = rng.choice(REPORT_PEOPLE) if rng.random() > 0.1 else None
+            ws.write_row(row, 3, [
+                f"{case_number:08d}",
+                responsible,
+                rng.choice(REPORT_CONTACTS),
+                f"{rng.choice(REPORT_SUBJECTS)} [{case_number}]",
+                f"{opened.month}/{opened.day}/{opened.year} {opened:%I:%M %p}".replace(" 0", " "),
+                rng.randrange(10),
+                f"Priority {rng.choice([1, 2, 3, 3, 4, 4, 4, 4])}",
+                "Service Request",
+                responsible or rng.choice(REPORT_PEOPLE),
+            ])
+            case_number += 1
+            row += 1
+        ws.write_row(row, 1, ["Subtotal", "Count", count])
+        row += 1
+    ws.write_row(row, 1, ["Total", "Count", tickets])
+
+    workbook.close()
+    return output
+
+
+def make_daas_queue(output, rows, days=7, start_date=datetime(2025, 9, 1), seed=0):
+    """Write a DaaS queue export with rows tickets spread over days (DATE merged per day) to output"""
+    rows = min(rows, MAX_ROWS)
+    rng = random.Random(seed)
+    statuses = [s for s, _ in QUEUE_STATUSES]
+    weights = [w for _, w in QUEUE_STATUSES]
+
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+    ws = workbook.add_worksheet("Sheet1")
+    date_format = workbook.add_format({'num_format': 'dd-mm-yyyy', 'valign': 'top'})
+    ws.write_row(0, 0, ["DATE", "CSM", "Resource", "Comments", "status"])
+
+    row = 1
+    for day, count in enumerate(_split(rows, [1] * max(1, min(days, rows)), rng)):
+        if not count:
+            continue
+        date = start_date + timedelta(days=day)
+        if count > 1:
+            _merge(ws, row, 0, row + count - 1, 0, date, date_format)
+        else:
+            ws.write_datetime(row, 0, date, date_format)
+        for i in range(count):
+            ws.write_row(row, 1, [
+                9850000 + row,
+                rng.choice(QUEUE_RESOURCES),
+                rng.choice(QUEUE_COMMENTS),
+                rng.choices(statuses, weights)[0],
+            ])
+            row += 1
+
+    workbook.close()
+    return output
@@ -0,0 +1,223 @@
+"""
+Benchmark suite on synthetic inputs: DaaS queue extraction, upload preparation, ticket
+triage actions, chart generation and the weekly deck, for each input size.
+
+    python -m benchmarks.suite --sizes 1000,10000,100000 --output benchmark_results.json
+
+Sizes up to 1000000 rows are supported, but openpyxl needs minutes and several GB for
+them. main.py runs in Streamlit's bare mode inside a scratch directory, since it writes
+working_file.xlsx and the artifact store into the current directory; the week history
+is redirected there too.
+"""
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from benchmarks.chart_update import _timed
+from benchmarks.generators import make_daas_queue, make_report_workbook
+
+BENCHMARKS = ["extract_queue", "upload_preparation", "triage", "charts", "weekly_deck"]
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _quiet(func):
+    """Call func with stdout swallowed - the app and the extractor print a lot of debugging"""
+    def call():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return func()
+    return call
+
+
+def _fresh_session(app):
+    """Empty the bare-mode session and rerun main.py's module level setup (session defaults)"""
+    for key in list(app.st.session_state.keys()):
+        del app.st.session_state[key]
+    return importlib.reload(app)
+
+
+def _triage_step(app, action):
+    """One pass of the triage screen: skip subtotal rows like the UI, then update/delete the ticket"""
+    state = app.st.session_state
+    ticket = app.get_current_ticket_for_processing()
+    while ticket == "subtotal_found":
+        state.r.append(state.current_row)
+        state.current_row += 1
+        ticket = app.get_current_ticket_for_processing()
+    if not isinstance(ticket, dict):
+        return False
+    if action == "delete":
+        app.process_current_ticket("delete")
+    else:
+        app.process_current_ticket("update", "Benchmark action", "BMS")
+    return True
+
+
+def generate_inputs(size, workdir, seed=0):
+    """Write report_<size>.xlsx and queue_<size>.xlsx into workdir; returns paths and timings"""
+    inputs = {}
+    for name, make in (("report", make_report_workbook), ("queue", make_daas_queue)):
+        path = os.path.join(workdir, f"{name}_{size}.xlsx")
+        started = time.perf_counter()
+        make(path, size, seed=seed)
+        inputs[name] = {
+            'path': path,
+            'seconds': time.perf_counter() - started,
+            'bytes': os.path.getsize(path),
+        }
+    return inputs
+
+
+def run_size(app, size, workdir, repeat=3, actions=10, only=None):
+    """Every selected benchmark for one input size; a failing benchmark records its error and the rest go on"""
+    only = only or BENCHMARKS
+    inputs = generate_inputs(size, workdir)
+    with open(inputs['report']['path'], "rb") as f:
+        report_bytes = f.read()
+    with open(inputs['queue']['path'], "rb") as f:
+        queue_bytes = f.read()
+
+    from extract_queue_data import extract_resource_status_counts
+    import ppt_automation
+
+    results = {'inputs': {name: {k: v for k, v in info.items() if k != 'path'} for name, info in inputs.items()}}
+
+    def record(name, func):
+        if name not in only:
+            return
+        try:
+            results[name] = func()
+            print(f"[{size}] {name}: {json.dumps(results[name])}")
+        except Exception as e:
+            results[name] = {'error': f"{type(e).__name__}: {e}"}
+            print(f"[{size}] {name} failed: {e}")
+
+    record('extract_queue', lambda: _timed(
+        _quiet(lambda: extract_resource_status_counts(inputs['queue']['path'])), repeat))
+
+    def upload_preparation():
+        timings = []
+        for _ in range(repeat):
+            fresh = _fresh_session(app)
+            started = time.perf_counter()
+            _quiet(lambda: fresh.process_uploaded_file(io.BytesIO(report_bytes)))()
+            timings.append(time.perf_counter() - started)
+        return {'median_ms': statistics.median(timings) * 1000, 'min_ms': min(timings) * 1000, 'runs': repeat}
+    record('upload_preparation', upload_preparation)
+
+    # Triage, charts and the deck continue from a prepared session
+    app = _fresh_session(app)
+    _quiet(lambda: app.process_uploaded_file(io.BytesIO(report_bytes)))()
+
+    def triage():
+        timings = []
+        for i in range(actions):
+            action = "delete" if i % 5 == 4 else "update"
+            started = time.perf_counter()
+            if not _quiet(lambda: _triage_step(app, action))():
+                break
+            timings.append(time.perf_counter() - started)
+        if not timings:
+            return {'actions': 0}
+        return {
+            'actions': len(timings),
+            'median_ms': statistics.median(timings) * 1000,
+            'max_ms': max(timings) * 1000,
+        }
+    record('triage', triage)
+
+    record('charts', lambda: {
+        'xlsxwriter': _timed(_quiet(app.generate_charts_with_xlsxwriter), repeat),
+        'openpyxl': _timed(_quiet(app.generate_charts_with_openpyxl), repeat),
+    })
+
+    def weekly_deck():
+        app.st.session_state.temp_daas_data = _quiet(lambda: app.process_temp_daas_file(io.BytesIO(queue_bytes)))()
+        app.st.session_state.temp_daas_processed = True
+        combined_data = app.build_combined_json_data()
+        template_path = os.path.join(REPO_DIR, "template.pptx")
+
+        def build(incremental):
+            if not incremental:
+                ppt_automation._slide_cache.clear()
+            ppt_automation.generate_report_from_data(template_path, io.BytesIO(), combined_data)
+
+        build(True)  # warm the template cache
+        return {
+            'days': len((combined_data.get('slide5_data') or {}).get('daily_data') or {}),
+            'full': _timed(lambda: build(False), repeat),
+            'incremental_unchanged': _timed(lambda: build(True), repeat),
+        }
+    record('weekly_deck', weekly_deck)
+
+    return results
+
+
+def run(sizes, repeat=3, actions=10, only=None, workdir=None):
+    """Results of every size, with the environment they were measured in"""
+    cleanup = workdir is None
+    workdir = os.path.abspath(workdir or tempfile.mkdtemp(prefix="csm-bench-"))
+    os.makedirs(workdir, exist_ok=True)
+    previous_dir = os.getcwd()
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+
+    results = {
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'started': datetime.now().isoformat(timespec="seconds"),
+        },
+        'settings': {'repeat': repeat, 'actions': actions},
+        'sizes': {},
+    }
+    try:
+        os.chdir(workdir)
+        app = _quiet(lambda: importlib.import_module("main"))()
+        # Synthetic weeks must not end up in the app's real week history
+        import week_history
+        week_history.HISTORY_DB_PATH = os.path.join(workdir, "week_history.sqlite3")
+        # Every st.* call outside a script run logs a missing ScriptRunContext warning
+        logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").setLevel(logging.ERROR)
+        for size in sizes:
+            results['sizes'][str(size)] = run_size(app, size, workdir, repeat, actions, only)
+    finally:
+        os.chdir(previous_dir)
+        if cleanup:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma separated row counts (up to 1000000)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--actions", type=int, default=10, help="triage actions timed per size")
+    parser.add_argument("--only", help=f"comma separated subset of: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--workdir", help="keep generated inputs and app files here (default: a temporary directory)")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON results file")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    only = [name.strip() for name in args.only.split(",")] if args.only else None
+    output = os.path.abspath(args.output)
+
+    results = run(sizes, args.repeat, args.actions, only, args.workdir)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
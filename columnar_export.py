@@ -0,0 +1,125 @@
+import os
+from datetime import datetime
+
+import pandas as pd
+
+# Parquet files for BI tools (DuckDB, pandas) - one file per table per reporting week
+EXPORT_DIR = os.environ.get("CSM_EXPORT_DIR", "exports")
+
+# Column positions in the processed 'Cloud Services Report' sheet
+FIRST_TICKET_ROW = 13
+STATUS_COL, CASE_NUMBER_COL, USER_COL, SUBJECT_COL = 2, 4, 5, 7
+ACTION_COL, ACCOUNT_COL, PRIORITY_COL = 8, 9, 12
+
+
+def _text(value):
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def triaged_tickets_frame(ws, week_start=None, first_row=FIRST_TICKET_ROW):
+    """One row per ticket in the processed sheet with the status carried down like the triage screen"""
+    records = []
+    status = None
+    for row_number, row in enumerate(ws.iter_rows(min_row=first_row, values_only=True), start=first_row):
+        if len(row) < PRIORITY_COL:
+            row = tuple(row) + (None,) * (PRIORITY_COL - len(row))
+        status_cell = _text(row[STATUS_COL - 1])
+        if status_cell == "Total":
+            break
+        if status_cell == "Subtotal":
+            continue
+        if status_cell is not None:
+            status = status_cell
+
+        case_number = _text(row[CASE_NUMBER_COL - 1])
+        user = _text(row[USER_COL - 1])
+        subject = _text(row[SUBJECT_COL - 1])
+        if not (case_number or user or subject):
+            continue
+
+        records.append({
+            'row': row_number,
+            'case_number': case_number,
+            'status': status,
+            'user': user,
+            'priority': _text(row[PRIORITY_COL - 1]),
+            'subject': subject,
+            'action': _text(row[ACTION_COL - 1]),
+            'account': _text(row[ACCOUNT_COL - 1]),
+        })
+
+    frame = pd.DataFrame.from_records(
+        records,
+        columns=['row', 'case_number', 'status', 'user', 'priority', 'subject', 'action', 'account']
+    )
+    frame.insert(0, 'week_start', pd.Timestamp(week_start) if week_start else pd.NaT)
+    return frame.astype({
+        'week_start': 'datetime64[ns]',
+        'row': 'int32',
+        'case_number': 'string',
+        'status': 'category',
+        'user': 'string',
+        'priority': 'category',
+        'subject': 'string',
+        'action': 'string',
+        'account': 'category',
+    })
+
+
+def queue_cube_frame(daas_queue_data, week_start=None):
+    """DaaS queue counts in long form: (date, dimension 'resource'/'status', name, tickets)"""
+    records = []
+    for date_label, data in ((daas_queue_data or {}).get('date_wise_data') or {}).items():
+        try:
+            date = datetime.strptime(date_label, '%d/%m/%Y')
+        except (TypeError, ValueError):
+            date = None
+        for dimension, key in (('resource', 'resources'), ('status', 'statuses')):
+            for name, tickets in (data.get(key) or {}).items():
+                records.append({
+                    'date': date,
+                    'date_label': date_label,
+                    'dimension': dimension,
+                    'name': name,
+                    'tickets': tickets,
+                })
+
+    frame = pd.DataFrame.from_records(records, columns=['date', 'date_label', 'dimension', 'name', 'tickets'])
+    frame.insert(0, 'week_start', pd.Timestamp(week_start) if week_start else pd.NaT)
+    return frame.astype({
+        'week_start': 'datetime64[ns]',
+        'date': 'datetime64[ns]',
+        'date_label': 'string',
+        'dimension': 'category',
+        'name': 'string',
+        'tickets': 'int64',
+    })
+
+
+def export_run_tables(ws, daas_queue_data, week_start, export_dir=None, tickets=None):
+    """
+    Write triaged_tickets_<week>.parquet and queue_cube_<week>.parquet, replacing the files of
+    the same week, so a glob like exports/triaged_tickets_*.parquet covers every recorded week.
+    tickets is a triaged_tickets_frame() already read from ws (ws is not touched then)
+    """
+    export_dir = export_dir or EXPORT_DIR
+    os.makedirs(export_dir, exist_ok=True)
+    week = week_start.strftime('%Y-%m-%d') if week_start else "undated"
+    if tickets is None:
+        tickets = triaged_tickets_frame(ws, week_start)
+
+    paths = []
+    for name, frame in (
+        ("triaged_tickets", tickets),
+        ("queue_cube", queue_cube_frame(daas_queue_data, week_start)),
+    ):
+        path = os.path.join(export_dir, f"{name}_{week}.parquet")
+        # Write next to the target and swap it in so readers never see a half written file
+        temp_path = path + ".tmp"
+        frame.to_parquet(temp_path, index=False)
+        os.replace(temp_path, path)
+        paths.append(path)
+    return paths
@@ -0,0 +1,127 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+
+class ExcelAppPool:
+    """
+    Keeps one hidden Excel instance alive between chart calls and shares an open
+    workbook across a whole generation pass, so charts cost one launch and one save.
+
+    COM objects belong to the thread that created them, while Streamlit reruns and the
+    artifact workers call in from different threads - so every Excel call is run on one
+    dedicated thread (COM initialised once), and workbooks/sheets never leave it
+    """
+
+    def __init__(self, xw_module=None, idle_timeout=300):
+        # xw_module lets a fake of the xlwings API be plugged in (e.g. on machines without Excel);
+        # the real xlwings is only imported when Excel is first started
+        self.xw = xw_module
+        self.idle_timeout = idle_timeout
+        self._app = None
+        self._books = {}
+        self._last_used = time.monotonic()
+        self._thread_id = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="excel-com", initializer=self._init_thread)
+
+    def _init_thread(self):
+        self._thread_id = threading.get_ident()
+        try:
+            import pythoncom
+            pythoncom.CoInitialize()
+        except ImportError:
+            # No COM outside Windows (macOS drives Excel through AppleScript)
+            pass
+
+    def run(self, func, *args, **kwargs):
+        """Call func on the Excel thread and return its result (directly when already on it)"""
+        if threading.get_ident() == self._thread_id:
+            return func(*args, **kwargs)
+        return self._executor.submit(func, *args, **kwargs).result()
+
+    def _is_healthy(self):
+        """Check the Excel instance still answers (it may have crashed or been closed by the user)"""
+        if self._app is None:
+            return False
+        try:
+            len(self._app.books)
+            return True
+        except Exception:
+            return False
+
+    def _quit_app(self):
+        app, self._app = self._app, None
+        self._books.clear()
+        if app is not None:
+            try:
+                app.quit()
+            except Exception as e:
+                print(f"Could not quit Excel cleanly: {e}")
+
+    def _get_app(self):
+        self._close_idle()
+        if not self._is_healthy():
+            self._quit_app()
+            if self.xw is None:
+                import xlwings
+                self.xw = xlwings
+            self._app = self.xw.App(visible=False, add_book=False)
+        self._last_used = time.monotonic()
+        return self._app
+
+    def start(self):
+        """Make sure a healthy Excel instance is running (raises when Excel cannot be started)"""
+        self.run(self._get_app)
+        return True
+
+    def _close_idle(self):
+        if self._app is not None and not self._books and time.monotonic() - self._last_used > self.idle_timeout:
+            self._quit_app()
+            return True
+        return False
+
+    def close_idle(self):
+        """Quit Excel when it has not been used for idle_timeout seconds and no pass is open"""
+        if self._app is None:
+            return False
+        return self.run(self._close_idle)
+
+    @contextmanager
+    def _generation_pass(self, file_path):
+        key = os.path.abspath(file_path)
+        book = self._books.get(key)
+        if book is not None:
+            # Nested pass on the same file - the outer pass saves
+            yield book
+            return
+
+        book = self._get_app().books.open(key)
+        self._books[key] = book
+        try:
+            yield book
+            book.save()
+        finally:
+            self._books.pop(key, None)
+            try:
+                book.close()
+            except Exception as e:
+                print(f"Could not close workbook {key}: {e}")
+            self._last_used = time.monotonic()
+
+    def _run_pass(self, file_path, func):
+        with self._generation_pass(file_path) as book:
+            return func(book)
+
+    def generation_pass(self, file_path, func):
+        """
+        Open file_path once, call func(book) on the Excel thread, then save and close it once.
+        Passes started from inside func on the same file reuse the open workbook
+        """
+        return self.run(self._run_pass, file_path, func)
+
+    def close(self):
+        """Quit Excel, forget all open workbooks and stop the Excel thread (the pool is done after this)"""
+        self.run(self._quit_app)
+        self._executor.shutdown(wait=True)
@@ -1,5 +1,6 @@
 import pandas as pd
 from collections import defaultdict
+import io
 import json
 import os
 
@@ -42,6 +43,7 @@ def normalize_status(status):
 def extract_resource_status_counts(file_path):
     """
     Extract resource, status and date-wise count data from Excel file
+    file_path may be a path or any seekable binary stream (e.g. an uploaded file)
     Returns dictionaries with counts for each resource, status, and date-wise breakdown
     """
     try:
@@ -293,6 +295,23 @@ def create_sample_data():
     
     return resource_counts, status_counts, date_wise_data
 
+def extract_queue_summary(source):
+    """
+    Counts of a DaaS queue export, with the sample data as fallback. source is a path or
+    stream, or bytes when it was sent to a worker process - module level and free of
+    Streamlit so it can run in one
+    """
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    resource_counts, status_counts, date_wise_data = extract_resource_status_counts(source)
+    if resource_counts is None:
+        resource_counts, status_counts, date_wise_data = create_sample_data()
+    return {
+        'resource_counts': resource_counts,
+        'status_counts': status_counts,
+        'date_wise_data': date_wise_data
+    }
+
 def main():
     file_path = r"C:\Users\sapth1504421\OneDrive - Mastek Limited\Desktop\devops_projects\Weekly_report_automation\inputs\temp_daas_queue.xlsx"
     
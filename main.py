@@ -1,23 +1,102 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
-from openpyxl import load_workbook
+from openpyxl import load_workbook, Workbook
 from copy import copy
-import xlwings as xw
 import xlsxwriter
 import json
+import io
+import importlib.util
 import os
+import sys
 import tempfile
 import time
 import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import multiprocessing
 from datetime import datetime, timedelta
 import re
-from extract_queue_data import extract_resource_status_counts, create_sample_data
-from ppt_automation import generate_weekly_report
+from extract_queue_data import extract_queue_summary, create_sample_data
+from ppt_automation import generate_report_from_data
+from excel_pool import ExcelAppPool
+from report_writer import stream_report_sheet, WORKBOOK_OPTIONS as REPORT_WORKBOOK_OPTIONS
+from week_history import build_slide6_data, parse_week_start, record_week
+from artifact_cache import ArtifactCache, snapshot_hash, file_hash
+from artifact_store import ArtifactStore
+from artifact_bundle import bundle_bytes
+from columnar_export import export_run_tables, triaged_tickets_frame
+from report_snapshot import encode_snapshot, load_snapshot, snapshot_file_info
 status_str = None
-def extract_date_period_from_excel(file_path):
-    """Extract date period from Excel file cell B7"""
+
+# Upload limits in bytes - uploads above MAX_UPLOAD_BYTES are rejected, streams that
+# are not already in memory spill to a temporary file above UPLOAD_SPOOL_BYTES
+MAX_UPLOAD_BYTES = int(os.environ.get("CSM_MAX_UPLOAD_BYTES", 200 * 1024 * 1024))
+UPLOAD_SPOOL_BYTES = int(os.environ.get("CSM_UPLOAD_SPOOL_BYTES", 16 * 1024 * 1024))
+
+def open_upload_stream(uploaded_file, max_bytes=None, spool_bytes=None):
+    """Return a rewound, seekable stream over an upload without copying it into a new bytes object"""
+    max_bytes = MAX_UPLOAD_BYTES if max_bytes is None else max_bytes
+    spool_bytes = UPLOAD_SPOOL_BYTES if spool_bytes is None else spool_bytes
+
+    size = getattr(uploaded_file, 'size', None)
+    if size is not None and size > max_bytes:
+        raise ValueError(f"Upload is {size} bytes, larger than the {max_bytes} byte limit")
+
+    # Streamlit uploads are already BytesIO objects - hand them over as they are
+    if isinstance(uploaded_file, io.BytesIO):
+        if size is None and uploaded_file.getbuffer().nbytes > max_bytes:
+            raise ValueError(f"Upload is larger than the {max_bytes} byte limit")
+        uploaded_file.seek(0)
+        return uploaded_file
+
+    # Any other readable stream is spooled in memory and only spills to disk past the threshold
+    spooled = tempfile.SpooledTemporaryFile(max_size=spool_bytes)
+    copied = 0
+    while True:
+        chunk = uploaded_file.read(1024 * 1024)
+        if not chunk:
+            break
+        copied += len(chunk)
+        if copied > max_bytes:
+            spooled.close()
+            raise ValueError(f"Upload is larger than the {max_bytes} byte limit")
+        spooled.write(chunk)
+    spooled.seek(0)
+    return spooled
+
+@st.cache_resource
+def get_worker_pool():
+    """Process-wide thread pool for background work (workers must not call st.*)"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="csm-worker")
+
+@st.cache_resource
+def get_process_pool():
+    """
+    Process-wide pool for CPU-bound parsing that should overlap with the script thread
+    (threads would just take turns on the GIL). Spawned, so workers start clean instead of
+    inheriting Streamlit's threads; jobs must be module level functions outside main.py
+    """
+    return ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+
+@st.cache_resource
+def get_excel_pool():
+    """Process-wide hidden Excel instance shared by the xlwings chart helpers"""
+    return ExcelAppPool(idle_timeout=int(os.environ.get("CSM_EXCEL_IDLE_TIMEOUT", 300)))
+
+@st.cache_resource
+def get_artifact_cache():
+    """Process-wide cache of generated artifact bytes keyed by the hash of their inputs"""
+    return ArtifactCache(max_bytes=int(os.environ.get("CSM_ARTIFACT_CACHE_BYTES", 256 * 1024 * 1024)))
+
+@st.cache_resource
+def get_artifact_store():
+    """Process-wide content-addressed store for generated JSON and PowerPoint files"""
+    return ArtifactStore()
+
+def extract_date_period_from_excel(source):
+    """Extract date period from Excel file cell B7 (path, stream or already loaded workbook)"""
     try:
-        wb = load_workbook(file_path)
+        wb = source if isinstance(source, Workbook) else load_workbook(source)
         if 'Cloud Services Report' in wb.sheetnames:
             ws = wb['Cloud Services Report']
         else:
@@ -210,19 +289,24 @@ if 'combined_json_data' not in st.session_state:
     st.session_state.combined_json_data = None
 if 'combined_json_path' not in st.session_state:
     st.session_state.combined_json_path = None
+if 'artifacts' not in st.session_state:
+    st.session_state.artifacts = {}
 if 'date_info' not in st.session_state:
     st.session_state.date_info = None
 if 'temp' not in st.session_state:
     st.session_state.temp = ['new', 'inprogress', 'awaiting', 'internal solution provided', 'resolved with customer', 'closed']
+
+# Quit the pooled Excel instance once it has been idle past its timeout
+get_excel_pool().close_idle()
+# Expire old generated artifacts in the background (at most once per cleanup interval)
+get_artifact_store().schedule_cleanup(get_worker_pool())
     
 
 
 def add_horizontal_chart(file_path, sheet_name, start_row, start_col, chart_title="Chart", chart_type="bar_clustered", chart_index=0):
-    """Create charts using xlwings"""
+    """Create charts using xlwings - shares the pooled workbook inside a generation pass"""
         
-    app = xw.App(visible=False)
-    try:
-        wb = app.books.open(file_path)
+    def draw(wb):
         sheet = wb.sheets[sheet_name]
 
         # Find last row of data
@@ -258,21 +342,18 @@ def add_horizontal_chart(file_path, sheet_name, start_row, start_col, chart_titl
         chart_api.Axes(1).TickLabels.Font.Size = 8
         chart_api.Axes(2).TickLabels.Font.Size = 8
 
-        wb.save()
-        wb.close()
+    try:
+        get_excel_pool().generation_pass(file_path, draw)
         return True
     except Exception as e:
         st.error(f"Error creating chart: {e}")
         return False
-    finally:
-        app.quit()
 
 def add_pie_chart(file_path, sheet_name, start_row, start_col, chart_title, chart_index=0):
-    """Create pie chart using xlwings"""
+    """Create pie chart using xlwings - shares the pooled workbook inside a generation pass"""
+    messages = []
         
-    app = xw.App(visible=False)
-    try:
-        wb = app.books.open(file_path)
+    def draw(wb):
         sheet = wb.sheets[sheet_name]
 
         # Find last row of data
@@ -298,7 +379,7 @@ def add_pie_chart(file_path, sheet_name, start_row, start_col, chart_title, char
             chart_api = chart.api[1]
             chart_api.HasTitle = True
             chart_api.ChartTitle.Text = chart_title
-            
+        
             series = chart_api.SeriesCollection(1)
             series.HasDataLabels = True
             data_labels = series.DataLabels
@@ -306,22 +387,21 @@ def add_pie_chart(file_path, sheet_name, start_row, start_col, chart_title, char
             data_labels.ShowValue = True
             data_labels.ShowCategoryName = True
             data_labels.Position = -4142
-            
+        
             chart_api.HasLegend = True
             legend = chart_api.Legend
             legend.Position = -4107
-            
+        
         except Exception as format_error:
-            st.warning(f"Could not apply advanced formatting: {format_error}")
+            messages.append(("warning", f"Could not apply advanced formatting: {format_error}"))
 
-        wb.save()
-        wb.close()
+    try:
+        get_excel_pool().generation_pass(file_path, draw)
+        show_messages(messages)
         return True
     except Exception as e:
         st.error(f"Error creating pie chart: {e}")
         return False
-    finally:
-        app.quit()
 
 def add_horizontal_chart_xlwings(
     sheet,
@@ -332,9 +412,11 @@ def add_horizontal_chart_xlwings(
     width=300,
     height=200,
     font_size=8,
-    chart_index=0
+    chart_index=0,
+    messages=None
 ):
-    """Add horizontal bar chart to xlwings sheet - from main.py"""
+    """Add horizontal bar chart to xlwings sheet - from main.py. Runs on the Excel thread, so messages are collected for show_messages"""
+    messages = [] if messages is None else messages
     try:
         last_row = sheet.range((start_row, start_col)).end('down').row
         last_col = sheet.range((start_row, start_col)).end('right').column
@@ -372,12 +454,14 @@ def add_horizontal_chart_xlwings(
         chart_api.Axes(1).TickLabels.Font.Size = font_size
         chart_api.Axes(2).TickLabels.Font.Size = font_size
 
-        st.success(f"Chart '{chart_title}' added successfully!")
+        messages.append(("success", f"Chart '{chart_title}' added successfully!"))
     except Exception as e:
-        st.error(f"Error creating chart: {e}")
+        messages.append(("error", f"Error creating chart: {e}"))
+    return messages
 
-def add_pie_chart_xlwings(sheet, start_row, start_col, chart_title, chart_index=0):
-    """Add pie chart to xlwings sheet - from main.py"""
+def add_pie_chart_xlwings(sheet, start_row, start_col, chart_title, chart_index=0, messages=None):
+    """Add pie chart to xlwings sheet - from main.py. Runs on the Excel thread, so messages are collected for show_messages"""
+    messages = [] if messages is None else messages
     try:
         last_row = sheet.range((start_row, start_col)).end('down').row
         last_col = start_col + 1
@@ -411,49 +495,40 @@ def add_pie_chart_xlwings(sheet, start_row, start_col, chart_title, chart_index=
             chart_api.HasLegend = True
             legend = chart_api.Legend
             legend.Position = -4107
-            st.success("Pie chart enhanced with data labels and legend")
+            messages.append(("success", "Pie chart enhanced with data labels and legend"))
         except Exception as format_error:
-            st.warning(f"Warning: Could not apply advanced formatting: {format_error}")
+            messages.append(("warning", f"Warning: Could not apply advanced formatting: {format_error}"))
 
-        st.success(f"Pie chart '{chart_title}' added successfully!")
+        messages.append(("success", f"Pie chart '{chart_title}' added successfully!"))
     except Exception as e:
-        st.error(f"Error creating pie chart: {e}")
+        messages.append(("error", f"Error creating pie chart: {e}"))
+    return messages
+
+def show_messages(messages):
+    """Show (kind, text) messages collected on the Excel thread, which has no script context"""
+    for kind, text in messages:
+        getattr(st, kind)(text)
 
 def process_temp_daas_file(temp_daas_file):
     """Process temp_daas_queue file in background"""
     if temp_daas_file is not None:
-        # Save temp file
-        temp_daas_path = "temp_daas_queue.xlsx"
-        with open(temp_daas_path, "wb") as f:
-            f.write(temp_daas_file.getvalue())
-        
-        # Extract data using existing function
-        resource_counts, status_counts, date_wise_data = extract_resource_status_counts(temp_daas_path)
-        
-        # If extraction failed, use sample data
-        if resource_counts is None:
-            resource_counts, status_counts, date_wise_data = create_sample_data()
-        
-        return {
-            'resource_counts': resource_counts,
-            'status_counts': status_counts,
-            'date_wise_data': date_wise_data
-        }
+        # Parse straight from the upload stream - no copy in memory or on disk
+        return extract_queue_summary(open_upload_stream(temp_daas_file))
     return None
 
 def process_uploaded_file(uploaded_file):
     """Process uploaded file using simplified logic from main.py"""
-    # Save uploaded file as working file
+    # Parse the workbook straight from the upload stream; only the processed
+    # workbook is saved as the working file further down
     temp_file_path = "working_file.xlsx"
-    with open(temp_file_path, "wb") as f:
-        f.write(uploaded_file.getvalue())
+    upload_stream = open_upload_stream(uploaded_file)
 
     st.session_state.file_path = temp_file_path
-    st.session_state.wb = load_workbook(temp_file_path)
+    st.session_state.wb = load_workbook(upload_stream)
     st.session_state.ws = st.session_state.wb['Cloud Services Report']
     
-    # Extract date period from B7 cell
-    date_info = extract_date_period_from_excel(temp_file_path)
+    # Extract date period from B7 cell of the workbook we already parsed
+    date_info = extract_date_period_from_excel(st.session_state.wb)
     st.session_state.date_info = date_info
     
     st.success(f"📅 Extracted Period: {date_info['period']}")
@@ -811,163 +886,110 @@ def process_current_ticket(action, action_text="", selected_account=""):
         st.session_state.wb.save(st.session_state.file_path)
         st.session_state.current_row += 1
 
+def get_chart_tables(stats):
+    """Stats tables shared by the chart backends: (section title, header, rows, chart kind, chart title)"""
+    return [
+        ("TICKET STATUS", ["Status", "Count"], list(stats['dict_status'].items()), "bar", "Ticket Status Count"),
+        ("Ticket Completed by Individual", ["Users", "Tickets"], list(stats['ticket_completed'].items()), "bar", "Users Completed"),
+        ("Priority wise ticket count", ["Priority", "Count"], list(stats['priority'].items()), "pie", "Priority Distribution"),
+        ("SLA", ["SLA Status", "Count"], list(stats['sla'].items()), "pie", "SLA MET vs SLA LOST"),
+        ("Ticket Count by Accountwise", ["Account", "Tickets"], list(stats['account_count'].items()), "bar", "Ticket Count by Accountwise"),
+    ]
+
+# Stats tables and charts live on their own sheet, so regenerating charts only rewrites
+# this sheet. Each table owns a block of at least CHART_BLOCK_ROWS rows (room for the
+# chart anchored next to it), grown to fit tables with more rows
+CHARTS_SHEET = "Charts"
+CHART_BLOCK_ROWS = 20
+
+def charts_sheet_name():
+    """CHARTS_SHEET, or 'Charts (2)', ... when the uploaded workbook already has a sheet of that name"""
+    taken = set(st.session_state.wb.sheetnames) if st.session_state.get('wb') is not None else set()
+    name, number = CHARTS_SHEET, 2
+    while name in taken:
+        name = f"{CHARTS_SHEET} ({number})"
+        number += 1
+    return name
+
+def get_chart_layout(stats):
+    """Stats tables with their (1-based) rows on the Charts sheet - every row of every table is kept"""
+    layout = []
+    title_row = 1
+    for section_title, header, rows, chart_kind, chart_title in get_chart_tables(stats):
+        layout.append({
+            'section_title': section_title,
+            'header': header,
+            'rows': rows,
+            'chart_kind': chart_kind,
+            'chart_title': chart_title,
+            'title_row': title_row,
+            'header_row': title_row + 1,
+            'first_row': title_row + 2,
+            'last_row': title_row + 1 + len(rows),
+        })
+        # Title, header, rows and a blank row before the next table
+        title_row += max(CHART_BLOCK_ROWS, len(rows) + 3)
+    return layout
+
+def chart_json_file(json_path, all_data):
+    """(file name, bytes) of the chart data JSON - built in memory, nothing is written"""
+    return os.path.basename(json_path), json.dumps(all_data, indent=4).encode("utf-8")
+
 def generate_charts_with_openpyxl():
-    """Generate charts using openpyxl while preserving ALL original styles, fonts, colors"""
+    """Generate charts using openpyxl on the live session workbook, preserving ALL original styles, fonts, colors"""
     try:
         stats = st.session_state.stats
 
-        # Load the original file to preserve formatting
-        wb = load_workbook(st.session_state.file_path)
-        ws = wb.active
-
-        # Find last row with data
-        last_row = ws.max_row
-        chart_start_row = last_row + 3
-        col_offset = 5  # Column E
+        # Charts go on their own sheet of the already parsed workbook - the report
+        # sheet is never touched and the file is not loaded again
+        wb = st.session_state.wb
+        chart_ws = wb.create_sheet(charts_sheet_name())
 
         from openpyxl.chart import BarChart, PieChart, Reference
 
-        # ===================== 1. Ticket Status =====================
-        ws.cell(row=chart_start_row, column=col_offset, value="TICKET STATUS")
-        row_offset = chart_start_row + 1
-        ws.cell(row=row_offset, column=col_offset, value="Status")
-        ws.cell(row=row_offset, column=col_offset + 1, value="Count")
-
-        for i, (status, count) in enumerate(stats['dict_status'].items()):
-            ws.cell(row=row_offset + i + 1, column=col_offset, value=status)
-            ws.cell(row=row_offset + i + 1, column=col_offset + 1, value=count)
-
-        chart1 = BarChart()
-        chart1.type = "bar"
-        chart1.style = 10
-        chart1.title = "Ticket Status Count"
-        chart1.y_axis.title = 'Status'
-        chart1.x_axis.title = 'Count'
-
-        data_end_row = row_offset + len(stats['dict_status'])
-        data = Reference(ws, min_col=col_offset + 1, min_row=row_offset + 1, max_row=data_end_row)
-        cats = Reference(ws, min_col=col_offset, min_row=row_offset + 1, max_row=data_end_row)
-        chart1.add_data(data, titles_from_data=False)
-        chart1.set_categories(cats)
-
-        for s in chart1.series:
-            s.graphicalProperties.solidFill = "5B9BD5"
-
-        chart1.gapWidth = 200
-        chart1.width = 15
-        chart1.height = 10
-        ws.add_chart(chart1, f"H{chart_start_row}")
-
-        # ===================== 2. User Ticket Completion =====================
-        users_start_row = data_end_row + 15
-        ws.cell(row=users_start_row, column=col_offset, value="Ticket Completed by Individual")
-        users_row_offset = users_start_row + 1
-        ws.cell(row=users_row_offset, column=col_offset, value="Users")
-        ws.cell(row=users_row_offset, column=col_offset + 1, value="Tickets")
-
-        for i, (user, count) in enumerate(stats['ticket_completed'].items()):
-            ws.cell(row=users_row_offset + i + 1, column=col_offset, value=user)
-            ws.cell(row=users_row_offset + i + 1, column=col_offset + 1, value=count)
-
-        chart2 = BarChart()
-        chart2.type = "bar"
-        chart2.style = 11
-        chart2.title = "Users Completed"
-        chart2.y_axis.title = 'Users'
-        chart2.x_axis.title = 'Tickets'
-
-        users_end_row = users_row_offset + len(stats['ticket_completed'])
-        data2 = Reference(ws, min_col=col_offset + 1, min_row=users_row_offset + 1, max_row=users_end_row)
-        cats2 = Reference(ws, min_col=col_offset, min_row=users_row_offset + 1, max_row=users_end_row)
-        chart2.add_data(data2, titles_from_data=False)
-        chart2.set_categories(cats2)
-
-        for s in chart2.series:
-            s.graphicalProperties.solidFill = "5B9BD5"
-
-        chart2.gapWidth = 200
-        chart2.width = 15
-        chart2.height = 10
-        ws.add_chart(chart2, f"H{users_start_row}")
-
-        # ===================== 3. Priority Distribution =====================
-        priority_start_row = users_end_row + 15
-        ws.cell(row=priority_start_row, column=col_offset, value="Priority wise ticket count")
-        priority_row_offset = priority_start_row + 1
-        ws.cell(row=priority_row_offset, column=col_offset, value="Priority")
-        ws.cell(row=priority_row_offset, column=col_offset + 1, value="Count")
-
-        for i, (priority, count) in enumerate(stats['priority'].items()):
-            ws.cell(row=priority_row_offset + i + 1, column=col_offset, value=priority)
-            ws.cell(row=priority_row_offset + i + 1, column=col_offset + 1, value=count)
-
-        chart3 = PieChart()
-        chart3.title = "Priority Distribution"
-        priority_end_row = priority_row_offset + len(stats['priority'])
-        data3 = Reference(ws, min_col=col_offset + 1, min_row=priority_row_offset + 1, max_row=priority_end_row)
-        cats3 = Reference(ws, min_col=col_offset, min_row=priority_row_offset + 1, max_row=priority_end_row)
-        chart3.add_data(data3, titles_from_data=False)
-        chart3.set_categories(cats3)
-        chart3.width = 15
-        chart3.height = 10
-        ws.add_chart(chart3, f"H{priority_start_row}")
-
-        # ===================== 4. SLA =====================
-        sla_start_row = priority_end_row + 15
-        ws.cell(row=sla_start_row, column=col_offset, value="SLA")
-        sla_row_offset = sla_start_row + 1
-        ws.cell(row=sla_row_offset, column=col_offset, value="SLA Status")
-        ws.cell(row=sla_row_offset, column=col_offset + 1, value="Count")
-        ws.cell(row=sla_row_offset + 1, column=col_offset, value="SLA MET")
-        ws.cell(row=sla_row_offset + 1, column=col_offset + 1, value=100)
-        ws.cell(row=sla_row_offset + 2, column=col_offset, value="SLA LOST")
-        ws.cell(row=sla_row_offset + 2, column=col_offset + 1, value=0)
-
-        chart4 = PieChart()
-        chart4.title = "SLA MET vs SLA LOST"
-        data4 = Reference(ws, min_col=col_offset + 1, min_row=sla_row_offset + 1, max_row=sla_row_offset + 2)
-        cats4 = Reference(ws, min_col=col_offset, min_row=sla_row_offset + 1, max_row=sla_row_offset + 2)
-        chart4.add_data(data4, titles_from_data=False)
-        chart4.set_categories(cats4)
-        chart4.width = 15
-        chart4.height = 10
-        ws.add_chart(chart4, f"H{sla_start_row}")
-
-        # ===================== 5. Account Count =====================
-        account_start_row = sla_row_offset + 18
-        ws.cell(row=account_start_row, column=col_offset, value="Ticket Count by Accountwise")
-        account_row_offset = account_start_row + 1
-        ws.cell(row=account_row_offset, column=col_offset, value="Account")
-        ws.cell(row=account_row_offset, column=col_offset + 1, value="Tickets")
-
-        for i, (account, count) in enumerate(stats['account_count'].items()):
-            ws.cell(row=account_row_offset + i + 1, column=col_offset, value=account)
-            ws.cell(row=account_row_offset + i + 1, column=col_offset + 1, value=count)
-
-        chart5 = BarChart()
-        chart5.type = "bar"
-        chart5.style = 12
-        chart5.title = "Ticket Count by Accountwise"
-        chart5.y_axis.title = 'Account'
-        chart5.x_axis.title = 'Tickets'
-
-        account_end_row = account_row_offset + len(stats['account_count'])
-        data5 = Reference(ws, min_col=col_offset + 1, min_row=account_row_offset + 1, max_row=account_end_row)
-        cats5 = Reference(ws, min_col=col_offset, min_row=account_row_offset + 1, max_row=account_end_row)
-        chart5.add_data(data5, titles_from_data=False)
-        chart5.set_categories(cats5)
-
-        for s in chart5.series:
-            s.graphicalProperties.solidFill = "5B9BD5"
-
-        chart5.gapWidth = 200
-        chart5.width = 15
-        chart5.height = 10
-        ws.add_chart(chart5, f"H{account_start_row}")
-
-        # ===================== Save Excel & JSON =====================
-        output_path = st.session_state.file_path.replace('.xlsx', '_with_charts.xlsx')
-        wb.save(output_path)
+        try:
+            chart_ws.column_dimensions['A'].width = 30
+            chart_ws.column_dimensions['B'].width = 10
+
+            for table in get_chart_layout(stats):
+                chart_ws.cell(row=table['title_row'], column=1, value=table['section_title'])
+                chart_ws.cell(row=table['header_row'], column=1, value=table['header'][0])
+                chart_ws.cell(row=table['header_row'], column=2, value=table['header'][1])
+                for i, (label, count) in enumerate(table['rows']):
+                    chart_ws.cell(row=table['first_row'] + i, column=1, value=label)
+                    chart_ws.cell(row=table['first_row'] + i, column=2, value=count)
+
+                if table['chart_kind'] == "pie":
+                    chart = PieChart()
+                else:
+                    chart = BarChart()
+                    chart.type = "bar"
+                    chart.style = 10
+                    chart.y_axis.title = table['header'][0]
+                    chart.x_axis.title = table['header'][1]
+                    chart.gapWidth = 200
+                chart.title = table['chart_title']
+
+                data = Reference(chart_ws, min_col=2, min_row=table['first_row'], max_row=table['last_row'])
+                cats = Reference(chart_ws, min_col=1, min_row=table['first_row'], max_row=table['last_row'])
+                chart.add_data(data, titles_from_data=False)
+                chart.set_categories(cats)
+
+                if table['chart_kind'] != "pie":
+                    for s in chart.series:
+                        s.graphicalProperties.solidFill = "5B9BD5"
+
+                chart.width = 15
+                chart.height = 10
+                chart_ws.add_chart(chart, f"D{table['title_row']}")
+
+            # ===================== Save Excel & JSON (in memory) =====================
+            output_path = st.session_state.file_path.replace('.xlsx', '_with_charts.xlsx')
+            output = io.BytesIO()
+            wb.save(output)
+        finally:
+            # Keep the session workbook identical to the processed report
+            wb.remove(chart_ws)
 
         all_data = {
             'ticket_status_data': stats['dict_status'],
@@ -978,16 +1000,90 @@ def generate_charts_with_openpyxl():
             'account_data': stats['account_count']
         }
 
-        json_path = output_path.replace('.xlsx', '_data.json')
-        with open(json_path, "w") as f:
-            json.dump(all_data, f, indent=4)
-
-        return output_path, json_path
+        return (
+            (os.path.basename(output_path), output.getvalue()),
+            chart_json_file(output_path.replace('.xlsx', '_data.json'), all_data)
+        )
 
     except Exception as e:
         st.error(f"Error generating charts with openpyxl: {e}")
         return None, None
 
+def generate_charts_with_xlsxwriter():
+    """Generate stats tables and native charts with xlsxwriter - headless, no Excel and no workbook reload"""
+    try:
+        stats = st.session_state.stats
+        ws = st.session_state.ws
+        output_path = st.session_state.file_path.replace('.xlsx', '_charts.xlsx')
+        output = io.BytesIO()
+
+        # constant_memory flushes each row as soon as the next one starts
+        workbook = xlsxwriter.Workbook(output, REPORT_WORKBOOK_OPTIONS)
+        date_info = st.session_state.get('date_info') or {}
+        # Fixed creation date keeps the output identical for identical stats
+        workbook.set_properties({'created': date_info.get('report_date_obj', datetime(2025, 1, 1))})
+
+        title_format = workbook.add_format({'bold': True, 'font_size': 12})
+        header_format = workbook.add_format({'bold': True, 'bg_color': '#D9E1F2', 'border': 1})
+        cell_format = workbook.add_format({'border': 1})
+
+        # ===================== Report sheet (streamed from the live workbook) =====================
+        stream_report_sheet(workbook, ws, 'Cloud Services Report')
+
+        # ===================== Charts sheet =====================
+        chart_sheet = workbook.add_worksheet(CHARTS_SHEET)
+        chart_sheet.set_column(0, 0, 30)
+        chart_sheet.set_column(1, 1, 10)
+
+        for table in get_chart_layout(stats):
+            # xlsxwriter is 0-based, the layout is 1-based like openpyxl
+            title_row = table['title_row'] - 1
+            first_row = table['first_row'] - 1
+            last_row = table['last_row'] - 1
+            chart_sheet.write(title_row, 0, table['section_title'], title_format)
+            chart_sheet.write_row(title_row + 1, 0, table['header'], header_format)
+            for i, (label, count) in enumerate(table['rows']):
+                chart_sheet.write_row(first_row + i, 0, [label, count], cell_format)
+
+            series = {
+                'name': table['chart_title'],
+                'categories': [CHARTS_SHEET, first_row, 0, last_row, 0],
+                'values': [CHARTS_SHEET, first_row, 1, last_row, 1],
+            }
+            if table['chart_kind'] == "pie":
+                chart = workbook.add_chart({'type': 'pie'})
+                series['data_labels'] = {'category': True, 'value': True, 'percentage': True, 'position': 'best_fit'}
+                chart.add_series(series)
+            else:
+                chart = workbook.add_chart({'type': 'bar'})
+                series['fill'] = {'color': '#5B9BD5'}
+                series['gap'] = 200
+                chart.add_series(series)
+                chart.set_legend({'none': True})
+            chart.set_title({'name': table['chart_title'], 'name_font': {'size': 10}})
+            chart.set_size({'width': 480, 'height': 288})
+            chart_sheet.insert_chart(title_row, 3, chart)
+
+        workbook.close()
+
+        all_data = {
+            'ticket_status_data': stats['dict_status'],
+            'individual_data': stats['ticket_completed'],
+            'main_chart_data': stats['dict_status'],
+            'pie1_data': stats['priority'],
+            'pie2_data': {"SLA MET": 100, "SLA LOST": 0},
+            'account_data': stats['account_count']
+        }
+
+        return (
+            (os.path.basename(output_path), output.getvalue()),
+            chart_json_file(output_path.replace('.xlsx', '_data.json'), all_data)
+        )
+
+    except Exception as e:
+        st.error(f"Error generating charts with xlsxwriter: {e}")
+        return None, None
+
 def generate_json_data_only():
     """Generate JSON data without charts for fallback"""
     try:
@@ -1002,211 +1098,271 @@ def generate_json_data_only():
             'pie2_data': {"SLA MET": 0, "SLA LOST": 0}  # Default SLA data
         }
         
-        # Save JSON file
+        # The processed workbook as it is on disk, plus the JSON built in memory
         json_path = st.session_state.file_path.replace('.xlsx', '_data.json')
-        with open(json_path, "w") as f:
-            json.dump(all_data, f, indent=4)
-        
-        return st.session_state.file_path, json_path
+        return st.session_state.file_path, chart_json_file(json_path, all_data)
         
     except Exception as e:
         st.error(f"Error generating JSON data: {e}")
         return None, None
 
-def generate_charts_and_save():
-    """Generate charts with fallback: xlwings -> xlsxwriter -> JSON only"""
+def generate_charts_with_xlwings():
+    """Generate charts on the Charts sheet of the working file through the pooled Excel instance (one open, one save)"""
     try:
-        # First try xlwings (works locally with Excel)
-        try:
-            st.info("Attempting to use xlwings for chart generation...")
-            app = xw.App(visible=False)
-            wb_xlwings = app.books.open(st.session_state.file_path)
-            ws_xlwings = wb_xlwings.sheets['Cloud Services Report']
-            chart_start_row = ws_xlwings.api.UsedRange.Rows.Count + 13
-            stats = st.session_state.stats
-
-            # Create data tables and charts - same approach as main.py but simplified
-            # Ticket Status Chart Data
-            ws_xlwings.range((chart_start_row, 5)).value = "TICKET STATUS"
-            status_data = [["Status", "Count"]] + list(stats['dict_status'].items())
-            ws_xlwings.range((chart_start_row + 1, 5)).value = status_data
-            
-            # User Ticket Completion Chart Data
-            users_data_start_row = chart_start_row + len(status_data) +13
-            ws_xlwings.range((users_data_start_row, 5)).value = "Ticket Completed by Individual"
-            users_data = [["Users", "Tickets"]] + list(stats['ticket_completed'].items())
-            ws_xlwings.range((users_data_start_row + 1, 5)).value = users_data
-
-            # Priority Distribution Chart Data
-            priority_data_start_row = users_data_start_row + len(users_data) + 13
-            ws_xlwings.range((priority_data_start_row, 5)).value = "Priority wise ticket count"
-            priority_data = [["Priority", "Count"]] + list(stats['priority'].items())
-            ws_xlwings.range((priority_data_start_row + 1, 5)).value = priority_data
-
-            # SLA Chart Data
-            sla_data_start_row = priority_data_start_row + len(priority_data) + 13
-            ws_xlwings.range((sla_data_start_row, 5)).value = "SLA"
-            sla_data = [["SLA Met", "SLA Lost"]] + [[100, 0]]
-            ws_xlwings.range((sla_data_start_row + 1, 5)).value = sla_data
-
-            # Account Count Chart Data
-            account_data_start_row = sla_data_start_row + len(sla_data) + 13
-            ws_xlwings.range((account_data_start_row, 5)).value = "Ticket Count by Accountwise"
-            account_data = [["Account", "Tickets"]] + list(stats['account_count'].items())
-            ws_xlwings.range((account_data_start_row + 1, 5)).value = account_data
-            
-            # Create charts using the working chart functions
-            add_horizontal_chart_xlwings(ws_xlwings, start_row=chart_start_row + 1, start_col=5, chart_title="Ticket Status Count", chart_index=0)
-            add_horizontal_chart_xlwings(ws_xlwings, start_row=users_data_start_row + 1, start_col=5, chart_title="Users Completed", chart_index=1)
-            add_pie_chart_xlwings(ws_xlwings, start_row=priority_data_start_row + 1, start_col=5, chart_title="Priority Distribution", chart_index=2)
-            add_pie_chart_xlwings(ws_xlwings, start_row=sla_data_start_row + 1, start_col=5, chart_title="SLA MET vs SLA LOST", chart_index=3)
-            add_horizontal_chart_xlwings(ws_xlwings, start_row=account_data_start_row + 1, start_col=5, chart_title="Ticket Count by Accountwise", chart_index=4)
-
-            wb_xlwings.save()
-            wb_xlwings.close()
-            app.quit()
-
-            # Export JSON data
-            all_data = {
-                "ticket_status": stats['dict_status'],
-                "ticket_completed": stats['ticket_completed'],
-                "priority_distribution": stats['priority'],
-                "sla": stats['sla'],
-                "account_count": stats['account_count']
-            }
-            
-            json_path = st.session_state.file_path.replace('.xlsx', '_data.json')
-            with open(json_path, "w") as f:
-                json.dump(all_data, f, indent=4)
-            
-            st.success("Charts generated successfully using xlwings!")
-            return st.session_state.file_path, json_path
-            
-        except Exception as xlwings_error:
-            st.warning(f"xlwings failed: {xlwings_error}")
-            st.info("Trying openpyxl with charts as fallback...")
-            
-            # Try openpyxl fallback (preserves styles and creates proper charts)
-            try:
-                excel_path, json_path = generate_charts_with_openpyxl()
-                if excel_path and json_path:
-                    st.success("Charts generated successfully using openpyxl!")
-                    return excel_path, json_path
-            except Exception as openpyxl_error:
-                st.warning(f"openpyxl charts also failed: {openpyxl_error}")
-            
-            # Final fallback - JSON only
-            st.info("Using JSON-only fallback...")
-            return generate_json_data_only()
+        stats = st.session_state.stats
+        messages = []
+        # A Charts sheet of the upload itself is left alone
+        sheet_name = charts_sheet_name()
+
+        def draw(wb_xlwings):
+            # Only the Charts sheet is rewritten - the report sheet stays as processed
+            if sheet_name in [sheet.name for sheet in wb_xlwings.sheets]:
+                chart_sheet = wb_xlwings.sheets[sheet_name]
+                for chart in list(chart_sheet.charts):
+                    chart.delete()
+                chart_sheet.clear()
+            else:
+                chart_sheet = wb_xlwings.sheets.add(sheet_name, after=wb_xlwings.sheets['Cloud Services Report'])
+
+            for table in get_chart_layout(stats):
+                chart_sheet.range((table['title_row'], 1)).value = table['section_title']
+                chart_sheet.range((table['header_row'], 1)).value = [table['header']] + [list(row) for row in table['rows']]
+
+                # Create charts using the working chart functions - each table has its own
+                # block of rows, so no extra per-chart offset is needed
+                if table['chart_kind'] == "pie":
+                    add_pie_chart_xlwings(chart_sheet, start_row=table['header_row'], start_col=1, chart_title=table['chart_title'], messages=messages)
+                else:
+                    add_horizontal_chart_xlwings(chart_sheet, start_row=table['header_row'], start_col=1, chart_title=table['chart_title'], messages=messages)
+
+        get_excel_pool().generation_pass(st.session_state.file_path, draw)
+        show_messages(messages)
+
+        # Export JSON data
+        all_data = {
+            "ticket_status": stats['dict_status'],
+            "ticket_completed": stats['ticket_completed'],
+            "priority_distribution": stats['priority'],
+            "sla": stats['sla'],
+            "account_count": stats['account_count']
+        }
+        
+        # Excel saved the workbook itself, so that one is read back from disk
+        json_path = st.session_state.file_path.replace('.xlsx', '_data.json')
+        return st.session_state.file_path, chart_json_file(json_path, all_data)
         
     except Exception as e:
-        st.error(f"Error generating charts: {e}")
+        st.warning(f"xlwings failed: {e}")
         return None, None
 
-def create_combined_json_data():
-    """Create combined JSON file with all processed data"""
+# Chart backend override: "auto" picks the first backend of CHART_BACKEND_ORDER that works on this machine
+# (xlsxwriter when CSM_REPORT_OUTPUT is "streaming"), otherwise one of "xlsxwriter", "openpyxl", "xlwings",
+# "json" is tried first
+CHART_BACKEND = os.environ.get("CSM_CHART_BACKEND", "auto").strip().lower()
+
+# Processed report output mode:
+#   "full"      - save the whole session workbook with openpyxl; every style and sheet is kept,
+#                 memory grows with the report
+#   "streaming" - write the report sheet row by row through report_writer's constant-memory
+#                 writer (xlsxwriter backend); values and key formatting are kept, multi-row
+#                 merges and other uploaded sheets are not. For very large reports
+REPORT_OUTPUT = os.environ.get("CSM_REPORT_OUTPUT", "full").strip().lower()
+
+# Measured with benchmarks.suite (--only charts, median of 2 runs): openpyxl 146ms vs xlsxwriter
+# 168ms at 1k rows, 2.2s vs 1.6s at 10k, 10.3s vs 11.6s at 50k - about a tie, so openpyxl goes
+# first for report sizes seen in practice. xlwings is last of the chart backends since it launches Excel
+CHART_BACKEND_ORDER = ["openpyxl", "xlsxwriter", "xlwings", "json"]
+
+@st.cache_resource
+def probe_chart_backends(start_excel=False):
+    """Probe which chart backends work on this machine - runs once per process (and argument)"""
+    available = {"xlsxwriter": True, "openpyxl": True, "json": True}
+    
+    # xlwings only drives a locally installed Excel (Windows/macOS) - never try to launch it elsewhere
+    available["xlwings"] = sys.platform in ("win32", "darwin") and importlib.util.find_spec("xlwings") is not None
+    if available["xlwings"] and start_excel:
+        try:
+            # Only when xlwings is the selected backend - the started instance stays in the pool for the first generation pass
+            get_excel_pool().start()
+        except Exception as e:
+            print(f"xlwings/Excel not available: {e}")
+            available["xlwings"] = False
+    
+    print(f"Chart backends available: {available}")
+    return available
+
+def select_chart_backends(override=None):
+    """Return the working chart backends in the order they should be tried"""
+    override = CHART_BACKEND if override is None else override
+    if override == "auto" and REPORT_OUTPUT == "streaming":
+        # The xlsxwriter backend is the one that streams the report sheet
+        override = "xlsxwriter"
+    available = probe_chart_backends(start_excel=override == "xlwings")
+    backends = [name for name in CHART_BACKEND_ORDER if available.get(name)]
+    
+    if override in backends:
+        backends.remove(override)
+        backends.insert(0, override)
+    elif override != "auto":
+        st.warning(f"Chart backend '{override}' is not available here, using {backends[0]}")
+    
+    return backends
+
+def generate_charts_and_save():
+    """Generate charts with the first available backend, falling back along the probed list"""
+    chart_backends = {
+        "xlsxwriter": generate_charts_with_xlsxwriter,
+        "openpyxl": generate_charts_with_openpyxl,
+        "xlwings": generate_charts_with_xlwings,
+        "json": generate_json_data_only,
+    }
+    
     try:
-        # Extract data from Excel processing
-        stats = st.session_state.stats
-        total_tasks = st.session_state.total
-        completed_tasks = sum([v for k, v in stats['dict_status'].items() if k in ['Resolved with Customer', 'Closed']])
-        
-        # Get temp_daas data
-        temp_daas_data = st.session_state.temp_daas_data
-        
-        # Prepare slide5 data from temp_daas processing
-        slide5_data = None
-        if temp_daas_data:
-            slide5_data = {
-                'summary_stats': {
-                    'total_tickets': sum(temp_daas_data['status_counts'].values()),
-                    'awaiting': temp_daas_data['status_counts'].get('Awaiting', 0),
-                    'closed': temp_daas_data['status_counts'].get('Closed', 0),
-                    'resolved': temp_daas_data['status_counts'].get('Resolved', 0)
-                },
-                'daily_data': {}
-            }
-            
-            # Convert date-wise data to daily format for slide5
-            for date, data in temp_daas_data.get('date_wise_data', {}).items():
-                slide5_data['daily_data'][date] = data.get('resources', {})
-        
-        # Get date information from extracted data
-        date_info = st.session_state.get('date_info', {
-            'period': '09/01/2025 to 09/07/2025',
-            'report_date': '8 September 2025', 
-            'new_date': '09/07/2025'
-        })
+        for backend in select_chart_backends():
+            st.info(f"Generating charts using {backend}...")
+            excel_file, json_file = chart_backends[backend]()
+            if excel_file and json_file:
+                st.success(f"Charts generated successfully using {backend}!")
+                return excel_file, json_file
         
-        # Create comprehensive JSON structure
-        # Main Excel data is used for slides 1-4 and slide 6
-        # temp_daas_queue data is ONLY used for slide 5
-        combined_data = {
-            "metadata": {
-                "report_date": date_info['report_date'],
-                "new_period": date_info['period'],
-                "new_date": date_info['new_date'],
-                "generation_timestamp": int(time.time()),
-                "total_tasks": total_tasks,
-                "completed_tasks": completed_tasks,
-                "extracted_from_b7": True
-            },
-            "main_report_data": {
-                # Data for slides 1-4 comes from main Excel file
-                "ticket_status_data": stats['dict_status'],  # Slide 2 chart 1
-                "individual_data": stats['ticket_completed'], # Slide 2 chart 2  
-                "main_chart_data": stats['account_count'],    # Slide 3 main chart
-                "pie1_data": stats['sla'],                    # Slide 3 pie chart 1
-                "pie2_data": stats['priority'],               # Slide 3 pie chart 2
-                "all_stats": stats
+        return None, None
+        
+    except Exception as e:
+        st.error(f"Error generating charts: {e}")
+        return None, None
+
+def build_combined_json_data():
+    """Build the combined report data (stats snapshot) from the session without writing any file"""
+    # Extract data from Excel processing
+    stats = st.session_state.stats
+    total_tasks = st.session_state.total
+    completed_tasks = sum([v for k, v in stats['dict_status'].items() if k in ['Resolved with Customer', 'Closed']])
+    
+    # Get temp_daas data
+    temp_daas_data = st.session_state.temp_daas_data
+    
+    # Prepare slide5 data from temp_daas processing
+    slide5_data = None
+    if temp_daas_data:
+        slide5_data = {
+            'summary_stats': {
+                'total_tickets': sum(temp_daas_data['status_counts'].values()),
+                'awaiting': temp_daas_data['status_counts'].get('Awaiting', 0),
+                'closed': temp_daas_data['status_counts'].get('Closed', 0),
+                'resolved': temp_daas_data['status_counts'].get('Resolved', 0)
             },
-            # temp_daas_queue data - ONLY for slide 5
-            "daas_queue_data": temp_daas_data,
-            "slide5_data": slide5_data,  # This uses temp_daas_queue data
-            "slide6_data": {
-                # Slide 6 uses main Excel data for current week, historical data can be static
-                'column_chart_data': {
-                    "August 2nd Week": 180,
-                    "August 3rd Week": 200, 
-                    "August 4th Week": 220,
-                    "September 1st Week": slide5_data["summary_stats"]["total_tickets"]  # From main Excel
-                },
-                'bar_chart_data': {
-                    "August 2nd Week": {
-                        'awaiting': 8,
-                        'closed': 5,
-                        'resolved': 187
-                    },
-                    "August 3rd Week": {
-                        'awaiting': 12,
-                        'closed': 3,
-                        'resolved': 165
-                    },
-                    "August 4th Week": {
-                        'awaiting': 12,
-                        'closed': 3,
-                        'resolved': 165
-                    },
-                    "September 1st Week": {
-                        # Current week data from main Excel
-                        'awaiting': slide5_data["summary_stats"]["awaiting"], 
-                        'closed': slide5_data["summary_stats"]["closed"],
-                        'resolved': slide5_data["summary_stats"]["resolved"]
-                    }
-                }
-            }
+            'daily_data': {}
         }
         
-        # Save JSON file
-        json_filename = f"combined_report_data_{int(time.time())}.json"
-        with open(json_filename, 'w') as f:
-            json.dump(combined_data, f, indent=4)
+        # Convert date-wise data to daily format for slide5
+        for date, data in temp_daas_data.get('date_wise_data', {}).items():
+            slide5_data['daily_data'][date] = data.get('resources', {})
+    
+    # Get date information from extracted data
+    date_info = st.session_state.get('date_info') or {
+        'period': '09/01/2025 to 09/07/2025',
+        'report_date': '8 September 2025', 
+        'new_date': '09/07/2025'
+    }
+    
+    # Create comprehensive JSON structure
+    # Main Excel data is used for slides 1-4 and slide 6
+    # temp_daas_queue data is ONLY used for slide 5
+    combined_data = {
+        "metadata": {
+            "report_date": date_info['report_date'],
+            "new_period": date_info['period'],
+            "new_date": date_info['new_date'],
+            "generation_timestamp": int(time.time()),
+            "total_tasks": total_tasks,
+            "completed_tasks": completed_tasks,
+            "extracted_from_b7": True
+        },
+        "main_report_data": {
+            # Data for slides 1-4 comes from main Excel file
+            "ticket_status_data": stats['dict_status'],  # Slide 2 chart 1
+            "individual_data": stats['ticket_completed'], # Slide 2 chart 2  
+            "main_chart_data": stats['account_count'],    # Slide 3 main chart
+            "pie1_data": stats['sla'],                    # Slide 3 pie chart 1
+            "pie2_data": stats['priority'],               # Slide 3 pie chart 2
+            "all_stats": stats
+        },
+        # temp_daas_queue data - ONLY for slide 5
+        "daas_queue_data": temp_daas_data,
+        "slide5_data": slide5_data,  # This uses temp_daas_queue data
+        # Slide 6 compares the current week with the previous weeks from the history store
+        "slide6_data": build_slide6_data(
+            parse_week_start(date_info),
+            slide5_data["summary_stats"] if slide5_data else None
+        )
+    }
+    
+    return combined_data
+
+def record_week_summary(combined_data):
+    """Store the current week's DaaS summary in the week history"""
+    slide5_data = combined_data.get('slide5_data')
+    week_start = parse_week_start({'period': combined_data['metadata']['new_period']})
+    if not slide5_data or week_start is None:
+        return
+    try:
+        daas_queue_data = combined_data.get('daas_queue_data') or {}
+        record_week(
+            week_start,
+            combined_data['metadata']['new_period'],
+            slide5_data['summary_stats'],
+            daas_queue_data.get('resource_counts')
+        )
+    except Exception as e:
+        st.warning(f"Could not update week history: {e}")
+
+def week_tickets_frame(combined_data):
+    """
+    Triaged tickets of the session sheet for the Parquet export. openpyxl's iter_rows creates
+    missing cells, so this must not run while another thread saves the session workbook
+    """
+    if st.session_state.ws is None:
+        return None
+    return triaged_tickets_frame(st.session_state.ws, parse_week_start({'period': combined_data['metadata']['new_period']}))
+
+def export_week_tables(combined_data, tickets=None):
+    """Write the triaged tickets and DaaS queue cube of this run as Parquet for BI tools"""
+    if st.session_state.ws is None:
+        return None
+    try:
+        return export_run_tables(
+            st.session_state.ws,
+            combined_data.get('daas_queue_data'),
+            parse_week_start({'period': combined_data['metadata']['new_period']}),
+            tickets=tickets
+        )
+    except Exception as e:
+        st.warning(f"Could not export Parquet tables: {e}")
+        return None
+
+def create_combined_json_data(combined_data=None, tickets=None):
+    """Create combined JSON file with all processed data (tickets: week_tickets_frame() already read)"""
+    try:
+        # Reuse a snapshot that was already built (e.g. by the Generate All pipeline)
+        if combined_data is None:
+            combined_data = build_combined_json_data()
+        
+        # JSON (or compact snapshot) bytes for the download; the stored copy is written in the background,
+        # filed under the report content without the per-run timestamp so identical reports dedupe
+        suffix, _ = snapshot_file_info()
+        snapshot = encode_snapshot(combined_data)
+        json_filename = archive_artifact(snapshot, suffix, snapshot_hash(without_generation_timestamp(combined_data)))
         
         # Store in session state for later use
         st.session_state.combined_json_data = combined_data
         st.session_state.combined_json_path = json_filename
         
-        return json_filename, combined_data
+        # Remember this week's summary for the slide 6 comparison of later weeks
+        record_week_summary(combined_data)
+        # Columnar copies of this run for analysts querying many weeks
+        export_week_tables(combined_data, tickets)
+        
+        return (json_filename, snapshot), combined_data
         
     except Exception as e:
         st.error(f"Error creating combined JSON: {e}")
@@ -1234,36 +1390,157 @@ def generate_ppt_from_json(json_data):
             st.error(f"Template file '{template_path}' not found. Please ensure template.pptx is in the project directory.")
             return None
         
-        output_path = f"final_report_{int(time.time())}.pptx"
-        
-        # Extract data from JSON
-        metadata = json_data['metadata']
-        main_data = json_data['main_report_data']
+        output = io.BytesIO()
         
         # Generate PPT using JSON data
-        generate_weekly_report(
-            template_path=template_path,
-            output_path=output_path,
-            report_date=metadata['report_date'],
-            new_period=metadata['new_period'],
-            total_tasks=metadata['total_tasks'],
-            completed_tasks=metadata['completed_tasks'],
-            ticket_status_data=main_data['ticket_status_data'],
-            individual_data=main_data['individual_data'],
-            main_chart_data=main_data['main_chart_data'],
-            pie1_data=main_data['pie1_data'],
-            pie2_data=main_data['pie2_data'],
-            new_date=metadata['new_date'],
-            slide5_data=json_data['slide5_data'],
-            slide6_data=json_data['slide6_data']
-        )
+        generate_report_from_data(template_path, output, json_data)
         
-        return output_path
+        data = output.getvalue()
+        return archive_artifact(data, ".pptx"), data
         
     except Exception as e:
         st.error(f"Error generating PowerPoint from JSON: {e}")
         return None
 
+def archive_artifact(data, suffix, digest=None):
+    """Keep a copy of generated bytes in the artifact store, written off the request path; returns its path"""
+    store = get_artifact_store()
+    get_worker_pool().submit(store.put_bytes, data, suffix, digest)
+    return store.path_for_data(data, suffix, digest)
+
+def cached_artifact(kind, inputs, build):
+    """
+    Return [(name, bytes), ...] for an artifact from the cache, or build it and cache its bytes.
+    build() returns (name, bytes) pairs made in memory, or paths of files a backend had to write
+    """
+    cache = get_artifact_cache()
+    key = snapshot_hash(kind, inputs)
+    files = cache.get(key)
+    if files is None:
+        built = build()
+        if not built or not all(built):
+            return None
+        
+        files = []
+        for item in built:
+            if isinstance(item, str):
+                with open(item, "rb") as f:
+                    item = (item, f.read())
+            files.append(item)
+        cache.put(key, files, size=sum(len(data) for _, data in files))
+    
+    # The session keeps only the cache key and file names - the bytes stay in the cache
+    st.session_state.artifacts[kind] = (key, [name for name, _ in files])
+    return files
+
+# File names inside the download bundle, by artifact kind and file position (the suffix is the artifact's own)
+BUNDLE_NAMES = {
+    "excel": ["processed_report", "report_data"],
+    "combined_json": ["combined_data"],
+    "pptx": ["final_report"],
+}
+
+def artifact_bundle_download(artifacts):
+    """
+    Callable for st.download_button that zips this session's artifacts when the button is
+    clicked, reading each one from the artifact cache in turn - nothing is held between reruns
+    """
+    cache = get_artifact_cache()
+    
+    def cached_file(key, index):
+        files = cache.get(key)
+        return files[index][1] if files and index < len(files) else None
+    
+    entries = []
+    for kind, (key, names) in artifacts.items():
+        for index, name in enumerate(names):
+            base = BUNDLE_NAMES.get(kind, [])
+            base = base[index] if index < len(base) else f"{kind}_{index + 1}"
+            entries.append((
+                f"{base}{os.path.splitext(name)[1]}",
+                lambda key=key, index=index: cached_file(key, index)
+            ))
+    return lambda: bundle_bytes(entries)
+
+# Sections of the combined report data that the PowerPoint is built from
+PPT_SECTIONS = ['metadata', 'main_report_data', 'slide5_data', 'slide6_data']
+
+def without_generation_timestamp(json_data, sections=None):
+    """Combined report data (optionally only some sections) minus the per-run timestamp, for hashing"""
+    metadata = {k: v for k, v in json_data['metadata'].items() if k != 'generation_timestamp'}
+    data = {name: json_data[name] for name in (sections or json_data.keys()) if name in json_data}
+    return {**data, 'metadata': metadata}
+
+def get_chart_artifacts():
+    """Chart workbook and chart JSON [(path, bytes), ...], rebuilt only when their inputs changed"""
+    inputs = [st.session_state.stats, st.session_state.total, file_hash(st.session_state.file_path), CHART_BACKEND, REPORT_OUTPUT]
+    return cached_artifact("excel", inputs, generate_charts_and_save)
+
+def get_combined_json_artifact(combined_data=None, tickets=None):
+    """Combined JSON [(path, bytes)], rebuilt only when the stats snapshot changed"""
+    if combined_data is None:
+        combined_data = build_combined_json_data()
+    files = cached_artifact(
+        "combined_json",
+        [without_generation_timestamp(combined_data)],
+        lambda: create_combined_json_data(combined_data, tickets)[:1]
+    )
+    if files:
+        # On a cache hit the session gets the cached snapshot, matching the cached file
+        st.session_state.combined_json_path = files[0][0]
+        st.session_state.combined_json_data = load_snapshot(files[0][1])
+    return files
+
+def get_ppt_artifact(json_data):
+    """PowerPoint [(path, bytes)], rebuilt only when the report data or template changed"""
+    if json_data is None:
+        return generate_ppt_from_json(json_data)
+    return cached_artifact(
+        "pptx",
+        [without_generation_timestamp(json_data, PPT_SECTIONS), file_hash("template.pptx")],
+        lambda: [generate_ppt_from_json(json_data)]
+    )
+
+def generate_all_artifacts(on_progress=None):
+    """Build the stats snapshot once, then create the chart workbook, combined JSON and PowerPoint concurrently"""
+    combined_data = build_combined_json_data()
+    # The session workbook is only touched by the chart job while the workers run - the
+    # Parquet export reads its tickets here, since iter_rows adds cells that would change
+    # the sheet under the chart job's wb.save()
+    try:
+        tickets = week_tickets_frame(combined_data)
+    except Exception as e:
+        st.warning(f"Could not read the tickets for the Parquet export: {e}")
+        tickets = None
+    
+    # Workers get this run's script context so their st.* messages and session
+    # state writes land in the right session; a short-lived pool keeps the
+    # context from leaking into threads reused by other sessions
+    ctx = get_script_run_ctx()
+    
+    def run_in_session(func, *args):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return func(*args)
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=3, thread_name_prefix="csm-artifact") as pool:
+        futures = {
+            pool.submit(run_in_session, get_chart_artifacts): "excel",
+            pool.submit(run_in_session, get_combined_json_artifact, combined_data, tickets): "combined_json",
+            pool.submit(run_in_session, get_ppt_artifact, combined_data): "pptx",
+        }
+        for future in as_completed(futures):
+            artifact = futures[future]
+            try:
+                results[artifact] = future.result()
+            except Exception as e:
+                st.error(f"Error generating {artifact}: {e}")
+                results[artifact] = None
+            if on_progress:
+                on_progress(artifact, results[artifact])
+    
+    return results
+
 # Main Streamlit App
 def main():
     st.title("📊 CSM Report Processor")
@@ -1321,12 +1598,31 @@ def main():
                 
                 if st.button("Start Processing Both Files", type="primary"):
                     with st.spinner("Processing uploaded files..."):
+                        # Parse the DaaS queue in a worker process while the main report is
+                        # processed here - process_uploaded_file needs the script thread for st.*
+                        try:
+                            daas_bytes = open_upload_stream(temp_daas_file).read()
+                        except ValueError as e:
+                            st.error(f"❌ {e}")
+                            st.stop()
+                        daas_future = get_process_pool().submit(extract_queue_summary, daas_bytes)
+                        
                         # Process main file
-                        process_uploaded_file(uploaded_file)
+                        try:
+                            process_uploaded_file(uploaded_file)
+                        except ValueError as e:
+                            st.error(f"❌ {e}")
+                            st.stop()
                         
-                        # Process temp_daas file in background
+                        # Join the DaaS queue result before the rerun
                         with st.spinner("Processing DaaS queue data..."):
-                            temp_daas_data = process_temp_daas_file(temp_daas_file)
+                            try:
+                                temp_daas_data = daas_future.result()
+                            except Exception as e:
+                                # e.g. the worker process died - parse it here instead
+                                print(f"DaaS worker failed, parsing in the script thread: {e}")
+                                st.warning(f"⚠️ Background DaaS queue parsing failed ({e}), parsed it inline instead")
+                                temp_daas_data = extract_queue_summary(daas_bytes)
                             if temp_daas_data:
                                 st.session_state.temp_daas_data = temp_daas_data
                                 st.session_state.temp_daas_processed = True
@@ -1459,6 +1755,74 @@ def main():
         st.markdown("### 📋 Report Generation")
         st.markdown("Generate various report formats from your processed data")
         
+        # One-click pipeline for all three artifacts
+        if st.button("⚡ Generate All Reports", type="primary", use_container_width=True):
+            if st.session_state.temp_daas_processed:
+                artifact_labels = {
+                    "excel": "📊 Excel report",
+                    "combined_json": "🔗 Combined JSON",
+                    "pptx": "🎯 PowerPoint",
+                }
+                progress_bar = st.progress(0)
+                artifact_status = {name: st.empty() for name in artifact_labels}
+                for name, label in artifact_labels.items():
+                    artifact_status[name].text(f"⏳ {label}: generating...")
+                
+                completed = []
+                
+                def show_artifact_progress(name, result):
+                    done = "✅" if result else "❌"
+                    artifact_status[name].text(f"{done} {artifact_labels[name]}: finished")
+                    completed.append(name)
+                    progress_bar.progress(int(100 * len(completed) / len(artifact_labels)))
+                
+                with st.spinner("🔄 Generating all reports..."):
+                    results = generate_all_artifacts(on_progress=show_artifact_progress)
+                
+                chart_files = results.get("excel")
+                combined_files = results.get("combined_json")
+                ppt_files = results.get("pptx")
+                
+                download_col1, download_col2, download_col3, download_col4 = st.columns(4)
+                if chart_files:
+                    with download_col1:
+                        st.download_button(
+                            label="📥 Download Excel Report",
+                            data=chart_files[0][1],
+                            file_name=f"processed_report_{int(time.time())}.xlsx",
+                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                            use_container_width=True
+                        )
+                    with download_col2:
+                        st.download_button(
+                            label="📄 Download JSON Data",
+                            data=chart_files[1][1],
+                            file_name=f"report_data_{int(time.time())}.json",
+                            mime="application/json",
+                            use_container_width=True
+                        )
+                if combined_files:
+                    with download_col3:
+                        st.download_button(
+                            label="📥 Download Combined JSON",
+                            data=combined_files[0][1],
+                            file_name=f"combined_data_{int(time.time())}{snapshot_file_info()[0]}",
+                            mime=snapshot_file_info()[1],
+                            use_container_width=True
+                        )
+                if ppt_files:
+                    st.session_state.ppt_generated = True
+                    with download_col4:
+                        st.download_button(
+                            label="📥 Download PowerPoint",
+                            data=ppt_files[0][1],
+                            file_name=f"final_report_{int(time.time())}.pptx",
+                            mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                            use_container_width=True
+                        )
+            else:
+                st.error("❌ Please process DaaS queue file first")
+        
         # Three main action cards
         col1, col2, col3 = st.columns(3)
         
@@ -1473,32 +1837,30 @@ def main():
                     
                     status_text.text("📊 Creating charts...")
                     progress_bar.progress(30)
-                    excel_path, json_path = generate_charts_and_save()
+                    chart_files = get_chart_artifacts()
                     
                     progress_bar.progress(100)
                     status_text.text("✅ Reports generated successfully!")
                 
-                if excel_path and json_path:
+                if chart_files:
                     st.success("📊 Charts generated successfully!")
                     
                     # Provide download buttons
-                    with open(excel_path, "rb") as file:
-                        st.download_button(
-                            label="📥 Download Excel Report",
-                            data=file.read(),
-                            file_name=f"processed_report_{int(time.time())}.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                            use_container_width=True
-                        )
+                    st.download_button(
+                        label="📥 Download Excel Report",
+                        data=chart_files[0][1],
+                        file_name=f"processed_report_{int(time.time())}.xlsx",
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        use_container_width=True
+                    )
                     
-                    with open(json_path, "rb") as file:
-                        st.download_button(
-                            label="📄 Download JSON Data",
-                            data=file.read(),
-                            file_name=f"report_data_{int(time.time())}.json",
-                            mime="application/json",
-                            use_container_width=True
-                        )
+                    st.download_button(
+                        label="📄 Download JSON Data",
+                        data=chart_files[1][1],
+                        file_name=f"report_data_{int(time.time())}.json",
+                        mime="application/json",
+                        use_container_width=True
+                    )
         
         with col2:
             st.markdown("#### 🔗 Combined JSON")
@@ -1512,26 +1874,25 @@ def main():
                         
                         status_text.text("🔗 Combining data sources...")
                         progress_bar.progress(50)
-                        json_path, json_data = create_combined_json_data()
+                        combined_files = get_combined_json_artifact()
                         
                         progress_bar.progress(100)
                         status_text.text("✅ Combined JSON created!")
                     
-                    if json_path and json_data:
+                    if combined_files:
                         st.success("🔗 Combined JSON created successfully!")
                         
-                        with open(json_path, "rb") as file:
-                            st.download_button(
-                                label="📥 Download Combined JSON",
-                                data=file.read(),
-                                file_name=f"combined_data_{int(time.time())}.json",
-                                mime="application/json",
-                                use_container_width=True
-                            )
+                        st.download_button(
+                            label="📥 Download Combined JSON",
+                            data=combined_files[0][1],
+                            file_name=f"combined_data_{int(time.time())}{snapshot_file_info()[0]}",
+                            mime=snapshot_file_info()[1],
+                            use_container_width=True
+                        )
                         
                         # Show JSON preview in an expandable section
                         with st.expander("🔍 Preview JSON Structure"):
-                            st.json(json_data['metadata'])
+                            st.json(st.session_state.combined_json_data['metadata'])
                 else:
                     st.error("❌ Please process DaaS queue file first")
         
@@ -1548,28 +1909,38 @@ def main():
                         
                         status_text.text("🎯 Creating PowerPoint slides...")
                         progress_bar.progress(30)
-                        ppt_path = generate_ppt_from_json(st.session_state.combined_json_data)
+                        ppt_files = get_ppt_artifact(st.session_state.combined_json_data)
                         
                         progress_bar.progress(100)
                         status_text.text("✅ PowerPoint generated!")
                     
-                    if ppt_path and os.path.exists(ppt_path):
+                    if ppt_files:
                         st.success("🎯 PowerPoint report generated successfully!")
                         st.session_state.ppt_generated = True
                         
-                        with open(ppt_path, "rb") as file:
-                            st.download_button(
-                                label="📥 Download PowerPoint",
-                                data=file.read(),
-                                file_name=f"final_report_{int(time.time())}.pptx",
-                                mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                                use_container_width=True
-                            )
+                        st.download_button(
+                            label="📥 Download PowerPoint",
+                            data=ppt_files[0][1],
+                            file_name=f"final_report_{int(time.time())}.pptx",
+                            mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                            use_container_width=True
+                        )
             else:
                 st.info("📝 Generate Combined JSON first")
                 if st.button("📝 Generate Combined JSON First", use_container_width=True):
                     st.rerun()
         
+        # Everything generated in this session as one zip, built only when it is downloaded
+        if st.session_state.artifacts:
+            st.download_button(
+                label="📦 Download All Reports (zip)",
+                data=artifact_bundle_download(st.session_state.artifacts),
+                file_name=f"weekly_reports_{int(time.time())}.zip",
+                mime="application/zip",
+                on_click="ignore",
+                use_container_width=True
+            )
+        
         st.markdown('</div>', unsafe_allow_html=True)
         
         # Reset option
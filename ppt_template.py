@@ -0,0 +1,393 @@
+import copy
+import io
+import re
+from datetime import datetime
+
+# Chart updates use python-pptx internals (chart._workbook, the chart data's workbook writer) -
+# requirements.txt pins the version they were written against
+from pptx.chart.data import CategoryChartData
+from pptx.chart.xmlwriter import SeriesXmlRewriterFactory
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+from pptx.text.text import _Paragraph
+from xlsxwriter import Workbook
+
+# Patterns used once per template to find the fields generation writes to
+REPORT_DATE_PATTERN = re.compile(r"\d{1,2}\s+[A-Za-z]+\s+\d{4}")
+PERIOD_PATTERN = re.compile(r"\(.*?\)")
+DATE_LINE_PATTERN = re.compile(r"Date:\s*\d{2}/\d{2}/\d{4}")
+TOKEN_PATTERN = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+# Slide 5 daily lines, written into copies of the template's own date / person paragraphs
+DAILY_DATE_LINE = "Date: {date}:"
+DAILY_PERSON_LINE = "No of Tickets by {person} - {tickets}"
+
+# Creation date written into embedded chart workbooks, so identical data gives identical bytes
+CHART_WORKBOOK_CREATED = datetime(2025, 1, 1)
+
+SLIDE2_TABLE_COLUMNS = [
+    ("Total Task", None, "{{total_tasks}}"),
+    ("Task Completed", None, "{{completed_tasks}}"),
+    ("% Completed", None, "{{percent_completed}}"),
+    ("Met SLA %", "Met SLA % ({{completed_tasks}}/{{total_tasks}})", "{{sla_percent}}"),
+]
+
+SLIDE5_SUMMARY_LINES = [
+    ("Total No. of Tickets", "Total No. of Tickets : {{total_tickets}}"),
+    ("Awaiting", "Awaiting : {{awaiting}}"),
+    ("Ticket Closed", "Ticket Closed : {{closed}}"),
+    ("Resolved with Customer", "Resolved with Customer : {{resolved}}"),
+]
+
+
+def paragraph_text(paragraph):
+    return "".join(run.text for run in paragraph.runs)
+
+
+def set_paragraph_text(paragraph, text):
+    """Replace a paragraph's text, keeping the formatting of its first run"""
+    runs = paragraph.runs
+    if runs:
+        runs[0].text = text
+        for run in runs[1:]:
+            run.text = ""
+    else:
+        paragraph.text = text
+
+
+def render_text(template, values):
+    """Fill {{name}} fields of a compiled text template (unknown names are left as they are)"""
+    return TOKEN_PATTERN.sub(lambda m: str(values.get(m.group(1), m.group(0))), template)
+
+
+def get_shape(prs, address):
+    slide_index, shape_index = address[:2]
+    return prs.slides[slide_index].shapes[shape_index]
+
+
+def get_text_frame(prs, address):
+    """Text frame of a shape (slide, shape) or of a table cell (slide, shape, row, col)"""
+    shape = get_shape(prs, address)
+    if len(address) == 4:
+        return shape.table.cell(address[2], address[3]).text_frame
+    return shape.text_frame
+
+
+def chart_workbook_blob(chart_data):
+    """
+    chart_data.xlsx_blob with a fixed creation date - python-pptx stamps the current time
+    into every embedded workbook, so identical charts would never produce identical files
+    """
+    xlsx_file = io.BytesIO()
+    workbook = Workbook(xlsx_file, {"in_memory": True})
+    workbook.set_properties({'created': CHART_WORKBOOK_CREATED})
+    chart_data._workbook_writer._populate_worksheet(workbook, workbook.add_worksheet())
+    workbook.close()
+    return xlsx_file.getvalue()
+
+
+def update_chart_data(chart, chart_data, refresh_workbook=False):
+    """
+    Rewrite a chart's series, category and value caches in the chart XML, and with
+    refresh_workbook its embedded workbook too (what chart.replace_data() does). Charts
+    linked to an external workbook keep only the XML update
+    """
+    SeriesXmlRewriterFactory(chart.chart_type, chart_data).replace_series_data(chart._chartSpace)
+    if refresh_workbook:
+        try:
+            chart._workbook.update_from_xlsx_blob(chart_workbook_blob(chart_data))
+        except ValueError as e:
+            print(f"Skipping workbook refresh of a linked chart: {e}")  # linked (external) workbook
+
+
+def _line_prototype(paragraph):
+    """Detached copy of a paragraph reduced to its first run, to stamp out new lines with"""
+    p = copy.deepcopy(paragraph._p)
+    for element in p.findall(qn('a:br')) + p.r_lst[1:]:
+        p.remove(element)
+    return p
+
+
+def layout_daily_lines(daily_data, capacities):
+    """
+    Pack the slide 5 day blocks (a date line, then a line per person) into text boxes of
+    the given line capacities, a page at a time. A block goes to the next box when it does
+    not fit; a block longer than a whole box is split and its date line repeated.
+    Returns pages: [[lines of box 1, lines of box 2, ...], ...], each line being
+    ('date' | 'person', text)
+    """
+    boxes = [[]]
+
+    def capacity(box_index):
+        return capacities[box_index % len(capacities)]
+
+    for date, people in daily_data.items():
+        date_line = ('date', DAILY_DATE_LINE.format(date=date))
+        block = [date_line]
+        for person, tickets in (people or {}).items():
+            tickets = f"{tickets:02d}" if isinstance(tickets, int) else tickets
+            block.append(('person', DAILY_PERSON_LINE.format(person=person, tickets=tickets)))
+
+        if boxes[-1] and len(boxes[-1]) + len(block) > capacity(len(boxes) - 1):
+            boxes.append([])
+        while len(block) > capacity(len(boxes) - 1):
+            room = capacity(len(boxes) - 1)
+            boxes[-1].extend(block[:room])
+            block = [date_line] + block[room:]
+            boxes.append([])
+        boxes[-1].extend(block)
+
+    per_page = len(capacities)
+    boxes.extend([] for _ in range(-len(boxes) % per_page))
+    return [boxes[i:i + per_page] for i in range(0, len(boxes), per_page)]
+
+
+def fill_daily_box(text_frame, lines, entry):
+    """Replace the paragraphs of a slide 5 daily box with lines from layout_daily_lines()"""
+    txBody = text_frame._txBody
+    for p in txBody.p_lst:
+        txBody.remove(p)
+    for kind, text in lines or [('date', "")]:
+        p = copy.deepcopy(entry['date_prototype' if kind == 'date' else 'person_prototype'])
+        txBody.append(p)
+        set_paragraph_text(_Paragraph(p, text_frame), text)
+
+
+def duplicate_slide(prs, slide_index, position):
+    """
+    Copy of a slide (background, shapes and their relationships; no notes) inserted at
+    position in the slide order
+    """
+    source = prs.slides[slide_index]
+    # Like prs.slides.add_slide() without cloning the layout placeholders
+    rId, slide = prs.part.add_slide(source.slide_layout)
+    sldIdLst = prs.slides._sldIdLst
+    sld_id = sldIdLst.add_sldId(rId)
+
+    rids = {}
+    for rId, rel in source.part.rels.items():
+        if rel.reltype not in (RT.SLIDE_LAYOUT, RT.NOTES_SLIDE):
+            target = rel.target_ref if rel.is_external else rel.target_part
+            rids[rId] = slide.part.relate_to(target, rel.reltype, rel.is_external)
+
+    copies = []
+    if source._element.cSld.bg is not None:
+        background = copy.deepcopy(source._element.cSld.bg)
+        slide._element.cSld.insert(0, background)
+        copies.append(background)
+    spTree = slide.shapes._spTree
+    for element in source.shapes._spTree.iterchildren():
+        if element.tag not in (qn('p:nvGrpSpPr'), qn('p:grpSpPr'), qn('p:extLst')):
+            element = copy.deepcopy(element)
+            spTree.insert_element_before(element, 'p:extLst')
+            copies.append(element)
+
+    r_namespace = qn('r:id')[:-len('id')]
+    for element in copies if rids else ():
+        for node in element.iter():
+            for name, value in node.attrib.items():
+                if name.startswith(r_namespace) and value in rids:
+                    node.set(name, rids[value])
+
+    sldIdLst.remove(sld_id)
+    sldIdLst.insert(position, sld_id)
+    return slide
+
+
+def _token_frames(prs):
+    """
+    Text frames (of shapes and table cells) whose paragraphs contain explicit {{tokens}}.
+    Runs are joined first, so a token split across runs by PowerPoint is still found
+    """
+    frames = {}
+    for slide_index, slide in enumerate(prs.slides):
+        for shape_index, shape in enumerate(slide.shapes):
+            text_frames = []
+            if shape.has_text_frame:
+                text_frames.append(((slide_index, shape_index), shape.text_frame))
+            if shape.has_table:
+                for row_index, row in enumerate(shape.table.rows):
+                    for col_index, cell in enumerate(row.cells):
+                        text_frames.append(((slide_index, shape_index, row_index, col_index), cell.text_frame))
+            for address, text_frame in text_frames:
+                for p_index, paragraph in enumerate(text_frame.paragraphs):
+                    text = paragraph_text(paragraph)
+                    if TOKEN_PATTERN.search(text):
+                        frames.setdefault(address, []).append((p_index, text, None))
+    return frames
+
+
+def _text_shapes(slide):
+    for shape_index, shape in enumerate(slide.shapes):
+        if shape.has_text_frame:
+            yield shape_index, shape
+
+
+def _chart_addresses(slide_index, slide):
+    return [(slide_index, i) for i, shape in enumerate(slide.shapes) if shape.has_chart]
+
+
+def _generic_template(text):
+    """Template for a paragraph with a 'Date: mm/dd/yyyy' and/or a '(period)' in it, or None"""
+    template = text
+    if "Date:" in template:
+        template = DATE_LINE_PATTERN.sub("Date: {{new_date}}", template)
+    if "(" in template and ")" in template:
+        template = PERIOD_PATTERN.sub("({{period}})", template)
+    return template if template != text else None
+
+
+def compile_template(prs):
+    """
+    Walk the template once and return a manifest that maps every field generation
+    fills in to a slide/shape/paragraph (or table cell / chart) address.
+
+    Paragraphs with explicit tokens ({{report_date}}, {{period}}, {{new_date}}, {{total_tasks}},
+    {{completed_tasks}}, {{percent_completed}}, {{sla_percent}}, {{total_tickets}}, {{awaiting}},
+    {{closed}}, {{resolved}}) are used as written; the sample text of the stock template is
+    recognised by the heuristics below and turned into the same kind of token templates.
+
+    text_frames  - [{'address': (slide, shape) or (slide, shape, row, col),
+                     'paragraphs': [(paragraph index, template with {{tokens}},
+                                     None | 'slide5_data' | 'no_slide5_data' | 'slide6_data')]}]
+    table_cells  - [{'address': (slide, shape, row, col), 'template': ...}]
+    charts       - {name: {'address': (slide, shape), 'series_name': ...}}
+    slide5_daily - [{'address': (slide, shape), 'capacity': lines per box,
+                     'date_prototype' / 'person_prototype': <a:p> elements to copy lines from}]
+    slide6_tables - [(slide, shape), ...]
+    """
+    manifest = {
+        'text_frames': [],
+        'table_cells': [],
+        'charts': {},
+        'slide5_daily': [],
+        'slide6_tables': [],
+    }
+    slides = list(prs.slides)
+
+    frames = _token_frames(prs)
+    token_paragraphs = {address + (p_index,) for address, lines in frames.items() for p_index, _, _ in lines}
+
+    def add_paragraph(address, template, requires=None):
+        # Explicit tokens win over the sample-text heuristics
+        if address not in token_paragraphs:
+            frames.setdefault(address[:2], []).append((address[2], template, requires))
+
+    # --- SLIDE 1: report date ---
+    if len(slides) >= 1:
+        for shape_index, shape in _text_shapes(slides[0]):
+            for p_index, paragraph in enumerate(shape.text_frame.paragraphs):
+                if paragraph.runs and REPORT_DATE_PATTERN.search(paragraph_text(paragraph)):
+                    add_paragraph((0, shape_index, p_index), "{{report_date}}")
+
+    # --- SLIDE 2: period, task table, charts ---
+    if len(slides) >= 2:
+        for shape_index, shape in _text_shapes(slides[1]):
+            for p_index, paragraph in enumerate(shape.text_frame.paragraphs):
+                text = paragraph_text(paragraph)
+                if paragraph.runs and "(" in text and ")" in text:
+                    add_paragraph((1, shape_index, p_index), PERIOD_PATTERN.sub("({{period}})", text))
+
+        for shape_index, shape in enumerate(slides[1].shapes):
+            if not shape.has_table:
+                continue
+            headers = [cell.text.strip() for cell in shape.table.rows[0].cells]
+            for col, header in enumerate(headers):
+                for prefix, header_template, value_template in SLIDE2_TABLE_COLUMNS:
+                    if header.startswith(prefix):
+                        for row, template in ((0, header_template), (1, value_template)):
+                            address = (1, shape_index, row, col)
+                            if template and address not in frames:
+                                manifest['table_cells'].append({'address': address, 'template': template})
+                        break
+
+        charts = _chart_addresses(1, slides[1])
+        if len(charts) >= 2:
+            manifest['charts']['ticket_status'] = {'address': charts[0], 'series_name': "Ticket Status"}
+            manifest['charts']['individual'] = {'address': charts[1], 'series_name': "Completed Tasks"}
+
+    # --- SLIDE 3: charts (existing series names are kept) ---
+    if len(slides) >= 3:
+        charts = _chart_addresses(2, slides[2])
+        if len(charts) >= 3:
+            for name, address, default_name in zip(
+                ('main', 'pie1', 'pie2'), charts[:3], ("Main Chart", "Pie 1", "Pie 2")
+            ):
+                chart = get_shape(prs, address).chart
+                series_name = chart.series[0].name if chart.series else default_name
+                manifest['charts'][name] = {'address': address, 'series_name': series_name}
+
+    # --- SLIDE 4: 'Date:' lines ---
+    if len(slides) >= 4:
+        for shape_index, shape in _text_shapes(slides[3]):
+            for p_index, paragraph in enumerate(shape.text_frame.paragraphs):
+                text = paragraph_text(paragraph)
+                if "Date:" in text:
+                    add_paragraph((3, shape_index, p_index), DATE_LINE_PATTERN.sub("Date: {{new_date}}", text))
+
+    # --- SLIDE 5: DaaS queue header, summary and daily lines ---
+    if len(slides) >= 5:
+        for shape_index, shape in _text_shapes(slides[4]):
+            shape_text = shape.text_frame.text
+            paragraphs = list(shape.text_frame.paragraphs)
+
+            if "DaaS - Queue Monitoring status for the period of" in shape_text:
+                for p_index, paragraph in enumerate(paragraphs):
+                    text = paragraph_text(paragraph)
+                    if "(" in text and ")" in text:
+                        add_paragraph((4, shape_index, p_index), PERIOD_PATTERN.sub("({{period}})", text))
+                continue
+
+            date_lines = [i for i, p in enumerate(paragraphs) if DATE_LINE_PATTERN.search(p.text)]
+            person_lines = [i for i, p in enumerate(paragraphs) if "No of Tickets by" in p.text]
+
+            if "Total No. of Tickets" in shape_text:
+                for p_index, (label, template) in enumerate(SLIDE5_SUMMARY_LINES):
+                    if p_index < len(paragraphs) and label in paragraphs[p_index].text:
+                        add_paragraph((4, shape_index, p_index), template, requires='slide5_data')
+            elif date_lines and person_lines:
+                # Any box of 'Date:' and 'No of Tickets by' lines holds daily counts; its
+                # paragraph count is how many lines it takes before the next box (or page)
+                manifest['slide5_daily'].append({
+                    'address': (4, shape_index),
+                    'capacity': max(2, len(paragraphs)),
+                    'date_prototype': _line_prototype(paragraphs[date_lines[0]]),
+                    'person_prototype': _line_prototype(
+                        paragraphs[min(person_lines, key=lambda i: len(paragraphs[i].runs))]
+                    ),
+                })
+
+            # Without slide 5 data only dates and periods are refreshed
+            for p_index, paragraph in enumerate(paragraphs):
+                template = _generic_template(paragraph.text)
+                if template:
+                    add_paragraph((4, shape_index, p_index), template, requires='no_slide5_data')
+
+    # --- SLIDE 6: dates, periods, comparison header, charts, tables ---
+    if len(slides) >= 6:
+        for shape_index, shape in _text_shapes(slides[5]):
+            for p_index, paragraph in enumerate(shape.text_frame.paragraphs):
+                template = _generic_template(paragraph_text(paragraph))
+                if template:
+                    add_paragraph((5, shape_index, p_index), template)
+
+            if "DaaS - Queue Monitoring comparison" in shape.text_frame.text:
+                for p_index, paragraph in enumerate(shape.text_frame.paragraphs):
+                    if "comparison with previous week" in paragraph.text:
+                        add_paragraph(
+                            (5, shape_index, p_index),
+                            "DaaS - Queue Monitoring comparison with previous week ({{period}})",
+                            requires='slide6_data'
+                        )
+
+        charts = _chart_addresses(5, slides[5])
+        if len(charts) >= 2:
+            manifest['charts']['weekly_tickets'] = {'address': charts[0], 'series_name': "Weekly Tickets"}
+            manifest['charts']['weekly_status'] = {'address': charts[1], 'series_name': None}
+
+        manifest['slide6_tables'] = [(5, i) for i, shape in enumerate(slides[5].shapes) if shape.has_table]
+
+    manifest['text_frames'] = [
+        {'address': address, 'paragraphs': lines} for address, lines in frames.items()
+    ]
+    return manifest
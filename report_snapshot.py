@@ -0,0 +1,89 @@
+import gzip
+import json
+import os
+from collections.abc import Mapping
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# "json" keeps the readable indented JSON; "msgpack" writes the compact binary snapshot
+SNAPSHOT_FORMAT = os.environ.get("CSM_SNAPSHOT_FORMAT", "json").lower()
+
+SCHEMA_VERSION = 1
+MAGIC = b"CSMSNAP\x00"
+
+
+def use_compact_format(fmt=None):
+    fmt = (fmt or SNAPSHOT_FORMAT).lower()
+    if fmt == "msgpack" and msgpack is None:
+        print("msgpack is not installed - writing combined report data as JSON")
+        return False
+    return fmt == "msgpack"
+
+
+def snapshot_file_info(fmt=None):
+    """(suffix, mime type) of snapshot files in the configured format"""
+    if use_compact_format(fmt):
+        return ".csmsnap", "application/octet-stream"
+    return ".json", "application/json"
+
+
+def encode_snapshot(data, fmt=None):
+    """
+    Serialize combined report data. The compact format is MAGIC followed by a msgpack map
+    {schema_version, sections}, where every top-level section is gzipped msgpack of its own
+    so a reader only decompresses the sections it touches
+    """
+    if not use_compact_format(fmt):
+        return json.dumps(data, indent=4).encode("utf-8")
+
+    sections = {
+        name: gzip.compress(msgpack.packb(value, use_bin_type=True), compresslevel=6)
+        for name, value in data.items()
+    }
+    return MAGIC + msgpack.packb({"schema_version": SCHEMA_VERSION, "sections": sections}, use_bin_type=True)
+
+
+class SnapshotReader(Mapping):
+    """Read-only dict view of a compact snapshot that decodes each section on first access"""
+
+    def __init__(self, payload):
+        if msgpack is None:
+            raise ValueError("msgpack is required to read compact report snapshots")
+        envelope = msgpack.unpackb(payload[len(MAGIC):], raw=False)
+        version = envelope.get("schema_version")
+        if version != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported report snapshot schema version: {version}")
+        self.schema_version = version
+        self._sections = envelope["sections"]
+        self._decoded = {}
+
+    def __getitem__(self, name):
+        if name not in self._decoded:
+            raw = self._sections[name]
+            self._decoded[name] = msgpack.unpackb(gzip.decompress(raw), raw=False, strict_map_key=False)
+        return self._decoded[name]
+
+    def __iter__(self):
+        return iter(self._sections)
+
+    def __len__(self):
+        return len(self._sections)
+
+    def to_dict(self):
+        """Decode every section into a plain dict"""
+        return {name: self[name] for name in self}
+
+
+def load_snapshot(payload):
+    """Combined report data from snapshot bytes - a lazy reader for compact snapshots, a dict for JSON"""
+    if payload[:len(MAGIC)] == MAGIC:
+        return SnapshotReader(payload)
+    return json.loads(payload)
+
+
+def read_snapshot(path):
+    with open(path, "rb") as f:
+        return load_snapshot(f.read())
@@ -0,0 +1,146 @@
+from datetime import date, datetime, time
+
+from openpyxl.utils import column_index_from_string
+
+# openpyxl border style -> xlsxwriter border index
+BORDER_STYLES = {
+    'thin': 1, 'medium': 2, 'dashed': 3, 'dotted': 4, 'thick': 5, 'double': 6, 'hair': 7,
+    'mediumDashed': 8, 'dashDot': 9, 'mediumDashDot': 10, 'dashDotDot': 11,
+    'mediumDashDotDot': 12, 'slantDashDot': 13,
+}
+
+HORIZONTAL_ALIGN = {'centerContinuous': 'center_across'}
+VERTICAL_ALIGN = {'center': 'vcenter', 'justify': 'vjustify', 'distributed': 'vdistributed'}
+
+DEFAULT_DATE_FORMAT = 'mm/dd/yyyy hh:mm'
+
+# Options for every streamed workbook (the processed report with CSM_REPORT_OUTPUT=streaming):
+# rows are flushed as soon as the next row starts, and text that looks like a URL stays
+# text like it was in the source workbook
+WORKBOOK_OPTIONS = {'constant_memory': True, 'strings_to_urls': False}
+
+
+def _rgb(color):
+    """'#RRGGBB' for an explicit openpyxl ARGB color, None for theme/indexed colors"""
+    if color is None or color.type != 'rgb' or not isinstance(color.rgb, str) or len(color.rgb) != 8:
+        return None
+    return f"#{color.rgb[2:]}"
+
+
+def _format_properties(cell):
+    """Translate the key parts of an openpyxl cell style to xlsxwriter format properties"""
+    props = {}
+
+    font = cell.font
+    if font.b:
+        props['bold'] = True
+    if font.i:
+        props['italic'] = True
+    if font.u:
+        props['underline'] = 1
+    if font.sz:
+        props['font_size'] = float(font.sz)
+    if font.name:
+        props['font_name'] = font.name
+    font_color = _rgb(font.color)
+    if font_color:
+        props['font_color'] = font_color
+
+    if cell.fill.fill_type == 'solid':
+        fill_color = _rgb(cell.fill.fgColor)
+        if fill_color:
+            props['bg_color'] = fill_color
+
+    if cell.number_format and cell.number_format != 'General':
+        props['num_format'] = cell.number_format
+
+    alignment = cell.alignment
+    if alignment.horizontal and alignment.horizontal != 'general':
+        props['align'] = HORIZONTAL_ALIGN.get(alignment.horizontal, alignment.horizontal)
+    if alignment.vertical:
+        props['valign'] = VERTICAL_ALIGN.get(alignment.vertical, alignment.vertical)
+    if alignment.wrap_text:
+        props['text_wrap'] = True
+
+    for side in ('left', 'right', 'top', 'bottom'):
+        border = getattr(cell.border, side)
+        if border is not None and border.style:
+            props[side] = BORDER_STYLES.get(border.style, 1)
+            border_color = _rgb(border.color)
+            if border_color:
+                props[f'{side}_color'] = border_color
+
+    return props
+
+
+def stream_report_sheet(workbook, ws, sheet_name=None):
+    """
+    Stream an openpyxl worksheet into an xlsxwriter workbook row by row, keeping
+    values, fonts, fills, borders, number formats, widths, heights and single-row merges
+    """
+    sheet = workbook.add_worksheet(sheet_name or ws.title)
+    formats = {}
+
+    def get_format(cell, is_date):
+        key = (cell.style_id if cell.has_style else None, is_date)
+        if key not in formats:
+            props = _format_properties(cell) if cell.has_style else {}
+            if is_date and 'num_format' not in props:
+                props['num_format'] = DEFAULT_DATE_FORMAT
+            formats[key] = workbook.add_format(props) if props else None
+        return formats[key]
+
+    for letter, dimension in ws.column_dimensions.items():
+        first_col = (dimension.min or column_index_from_string(letter)) - 1
+        last_col = (dimension.max or first_col + 1) - 1
+        options = {'hidden': True} if dimension.hidden else None
+        if dimension.width or options:
+            sheet.set_column(first_col, last_col, dimension.width or None, None, options)
+
+    # Multi-row merges cannot be written in constant_memory mode (rows already
+    # flushed cannot be revisited), so only single-row merges are kept
+    merges = {}
+    for merged in ws.merged_cells.ranges:
+        if merged.min_row == merged.max_row:
+            merges[(merged.min_row, merged.min_col)] = merged
+
+    for row_cells in ws.iter_rows():
+        if not row_cells:
+            continue
+        row_number = row_cells[0].row
+        row_index = row_number - 1
+
+        dimension = ws.row_dimensions.get(row_number)
+        if dimension is not None and (dimension.height or dimension.hidden):
+            sheet.set_row(row_index, dimension.height, None, {'hidden': True} if dimension.hidden else None)
+
+        pending_merges = []
+        for cell in row_cells:
+            value = cell.value
+            is_date = isinstance(value, (datetime, date, time))
+            cell_format = get_format(cell, is_date)
+
+            merged = merges.get((row_number, cell.column))
+            if merged is not None:
+                pending_merges.append((merged, value, cell_format))
+                continue
+
+            col_index = cell.column - 1
+            if value is None:
+                if cell_format is not None:
+                    sheet.write_blank(row_index, col_index, None, cell_format)
+            elif is_date:
+                sheet.write_datetime(row_index, col_index, value, cell_format)
+            else:
+                sheet.write(row_index, col_index, value, cell_format)
+
+        # Merged ranges are written last so the row is complete before they are added
+        for merged, value, cell_format in pending_merges:
+            if isinstance(value, (datetime, date, time)):
+                sheet.merge_range(row_index, merged.min_col - 1, row_index, merged.max_col - 1, "", cell_format)
+                sheet.write_datetime(row_index, merged.min_col - 1, value, cell_format)
+            else:
+                sheet.merge_range(row_index, merged.min_col - 1, row_index, merged.max_col - 1, value, cell_format)
+
+    return sheet
+
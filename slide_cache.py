@@ -0,0 +1,126 @@
+import copy
+import os
+import zipfile
+
+# save_presentation() and the slide snapshots use python-pptx internals (_ContentTypesItem,
+# package/part _rels, part _element) - requirements.txt pins the version they were written against
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+
+from artifact_cache import ArtifactCache
+
+# Rendered slides kept for incremental regeneration, bounded by their serialized size
+SLIDE_CACHE_BYTES = int(os.environ.get("CSM_SLIDE_CACHE_BYTES", 64 * 1024 * 1024))
+
+# Parts that are compressed already - deflating them again costs time and saves nothing
+STORED_EXTENSIONS = ('.jpeg', '.jpg', '.png', '.gif', '.xlsx', '.xlsm')
+
+# Every zip member gets this date instead of the save time, so identical decks are identical
+# bytes (and dedupe in the artifact store)
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def slide_parts(prs):
+    """
+    Slide parts of a presentation in slide order, looked up through the relationships
+    only, so no Slide proxy (which caches its XML element) is created
+    """
+    return [prs.part.related_part(sld_id.rId) for sld_id in prs.part._element.sldIdLst]
+
+
+def _chart_parts(slide_part):
+    return [rel.target_part for rel in slide_part.rels.values() if not rel.is_external and rel.reltype == RT.CHART]
+
+
+def _workbook_parts(chart_part):
+    return [rel.target_part for rel in chart_part.rels.values() if not rel.is_external and rel.reltype == RT.PACKAGE]
+
+
+def snapshot_slide(slide_part):
+    """
+    Copies of the XML trees of a rendered slide and its charts plus their embedded workbooks.
+    Trees are copied rather than serialized so a restored slide saves byte-for-byte the same
+    (a parse round trip would turn empty <a:t></a:t> runs into <a:t/>)
+    """
+    charts = []
+    size = len(serialize_part_xml(slide_part._element))
+    for chart_part in _chart_parts(slide_part):
+        workbooks = {str(part.partname): part.blob for part in _workbook_parts(chart_part)}
+        charts.append((str(chart_part.partname), copy.deepcopy(chart_part._element), workbooks))
+        size += len(serialize_part_xml(chart_part._element)) + sum(len(blob) for blob in workbooks.values())
+    return {'slide': copy.deepcopy(slide_part._element), 'charts': charts, 'size': size}
+
+
+def restore_slide(slide_part, snapshot):
+    """
+    Put a cached rendering back into an untouched slide part of a fresh template copy.
+    Returns False (leaving the part alone) when the template's parts no longer match
+    """
+    chart_parts = {str(part.partname): part for part in _chart_parts(slide_part)}
+    if set(chart_parts) != {partname for partname, _, _ in snapshot['charts']}:
+        return False
+
+    slide_part._element = copy.deepcopy(snapshot['slide'])
+    for partname, element, workbooks in snapshot['charts']:
+        chart_part = chart_parts[partname]
+        chart_part._element = copy.deepcopy(element)
+        for workbook_part in _workbook_parts(chart_part):
+            blob = workbooks.get(str(workbook_part.partname))
+            if blob is not None:
+                workbook_part.blob = blob
+    return True
+
+
+def _write_member(zf, name, data, stored=False):
+    info = zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME)
+    info.compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+    info.external_attr = 0o600 << 16
+    zf.writestr(info, data)
+
+
+def save_presentation(prs, output):
+    """
+    prs.save() writing the same zip members in the same order, except that images and
+    embedded workbooks are stored as-is instead of being deflated a second time, and
+    members carry a fixed date instead of the save time
+    """
+    package = prs.part.package
+    parts = list(package.iter_parts())
+    with zipfile.ZipFile(output, "w") as zf:
+        _write_member(zf, CONTENT_TYPES_URI.membername, serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        _write_member(zf, PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        for part in parts:
+            _write_member(zf, part.partname.membername, part.blob,
+                          stored=part.partname.lower().endswith(STORED_EXTENSIONS))
+            if part._rels:
+                _write_member(zf, part.partname.rels_uri.membername, part.rels.xml)
+
+
+class SlideCache:
+    """Rendered slides keyed by a hash of the template and everything the slide is built from"""
+
+    def __init__(self, max_bytes=None):
+        self._cache = ArtifactCache(max_bytes=SLIDE_CACHE_BYTES if max_bytes is None else max_bytes)
+
+    def restore(self, prs, slide_keys):
+        """Restore every cached slide of slide_keys ({slide index: key}); returns the restored indexes"""
+        parts = slide_parts(prs)
+        restored = set()
+        for index, key in slide_keys.items():
+            snapshot = self._cache.get(key)
+            if snapshot is not None and index < len(parts) and restore_slide(parts[index], snapshot):
+                restored.add(index)
+        return restored
+
+    def store(self, prs, slide_keys):
+        """Remember the rendering of the slides in slide_keys"""
+        parts = slide_parts(prs)
+        for index, key in slide_keys.items():
+            if index < len(parts):
+                snapshot = snapshot_slide(parts[index])
+                self._cache.put(key, snapshot, size=snapshot['size'])
+
+    def clear(self):
+        self._cache.clear()
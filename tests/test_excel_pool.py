@@ -0,0 +1,153 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from excel_pool import ExcelAppPool
+
+
+class FakeBook:
+    def __init__(self, app, path):
+        self.app = app
+        self.path = path
+        self.saves = 0
+        self.closed = False
+
+    def save(self):
+        self.app.calls.append(("save", threading.get_ident()))
+        self.saves += 1
+
+    def close(self):
+        self.app.calls.append(("close", threading.get_ident()))
+        self.closed = True
+
+
+class FakeBooks:
+    def __init__(self, app):
+        self.app = app
+        self.opened = []
+
+    def __len__(self):
+        self.app.calls.append(("health", threading.get_ident()))
+        if self.app.crashed:
+            raise RuntimeError("Excel went away")
+        return len(self.opened)
+
+    def open(self, path):
+        self.app.calls.append(("open", threading.get_ident()))
+        book = FakeBook(self.app, path)
+        self.opened.append(book)
+        return book
+
+
+class FakeXw:
+    """Just enough of the xlwings API for ExcelAppPool, recording the thread of every call"""
+
+    def __init__(self):
+        self.apps = []
+
+    def App(self, visible=True, add_book=True):
+        fake = self
+
+        class FakeApp:
+            def __init__(self):
+                self.calls = [("start", threading.get_ident())]
+                self.crashed = False
+                self.quit_called = False
+                self.books = FakeBooks(self)
+                fake.apps.append(self)
+
+            def quit(self):
+                self.calls.append(("quit", threading.get_ident()))
+                self.quit_called = True
+
+        return FakeApp()
+
+
+@pytest.fixture
+def fake_xw():
+    return FakeXw()
+
+
+@pytest.fixture
+def make_pool(fake_xw):
+    """ExcelAppPool factory over fake_xw; every pool (and its Excel thread) is closed afterwards"""
+    pools = []
+
+    def make(**kwargs):
+        pool = ExcelAppPool(xw_module=fake_xw, **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.close()
+
+
+def test_all_excel_calls_run_on_one_thread(make_pool, fake_xw, tmp_path):
+    pool = make_pool()
+    caller_threads = set()
+
+    def chart_pass(i):
+        caller_threads.add(threading.get_ident())
+        return pool.generation_pass(tmp_path / f"book{i % 2}.xlsx", lambda book: threading.get_ident())
+
+    with ThreadPoolExecutor(max_workers=4) as callers:
+        worker_threads = set(callers.map(chart_pass, range(8)))
+
+    assert len(fake_xw.apps) == 1
+    excel_threads = {thread for _, thread in fake_xw.apps[0].calls}
+    assert worker_threads == excel_threads
+    assert len(excel_threads) == 1
+    assert not excel_threads & caller_threads
+
+
+def test_nested_pass_reuses_the_open_workbook(make_pool, fake_xw, tmp_path):
+    pool = make_pool()
+    path = tmp_path / "report.xlsx"
+
+    def outer(book):
+        inner = pool.generation_pass(path, lambda nested: nested)
+        assert inner is book
+        assert book.saves == 0
+        return book
+
+    book = pool.generation_pass(path, outer)
+    assert book.saves == 1 and book.closed
+    assert len(fake_xw.apps[0].books.opened) == 1
+
+
+def test_crashed_excel_is_restarted(make_pool, fake_xw, tmp_path):
+    pool = make_pool()
+    pool.start()
+    fake_xw.apps[0].crashed = True
+
+    pool.generation_pass(tmp_path / "report.xlsx", lambda book: None)
+    assert len(fake_xw.apps) == 2
+    assert fake_xw.apps[0].quit_called
+
+
+def test_idle_excel_is_quit(make_pool, fake_xw):
+    pool = make_pool(idle_timeout=0)
+    assert pool.close_idle() is False  # nothing started, nothing to do
+    pool.start()
+    assert pool.close_idle() is True
+    assert fake_xw.apps[0].quit_called
+
+
+def test_xlwings_is_not_imported_until_excel_starts(monkeypatch):
+    monkeypatch.delitem(sys.modules, "xlwings", raising=False)
+    pool = ExcelAppPool()
+    try:
+        assert "xlwings" not in sys.modules
+    finally:
+        pool.close()
+
+
+def test_close_stops_the_excel_thread(fake_xw):
+    pool = ExcelAppPool(xw_module=fake_xw)
+    pool.start()
+    pool.close()
+    assert fake_xw.apps[0].quit_called
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("excel-com")]
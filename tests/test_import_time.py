@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time budgets in seconds - about 3x what a warm import of main.py
+# takes today (~1.4s, most of it streamlit, pandas and openpyxl)
+MAIN_IMPORT_BUDGET = 5.0
+PPT_AUTOMATION_IMPORT_BUDGET = 1.0
+
+
+def import_times(cwd):
+    """Import main.py with -X importtime in a fresh interpreter; returns {module: cumulative seconds}"""
+    env = dict(os.environ, PYTHONPATH=REPO_DIR)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=cwd, env=env, capture_output=True, text=True, timeout=300,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        times[module.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def test_main_import_has_no_heavy_side_effects(tmp_path):
+    times = import_times(tmp_path)
+
+    # Excel automation is only loaded when the xlwings backend starts Excel
+    assert "xlwings" not in times
+    # ppt_automation used to build and save an example deck when imported
+    assert not list(tmp_path.glob("*.pptx"))
+
+    assert times["ppt_automation"] < PPT_AUTOMATION_IMPORT_BUDGET, times["ppt_automation"]
+    assert times["main"] < MAIN_IMPORT_BUDGET, times["main"]
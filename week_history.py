@@ -0,0 +1,152 @@
+import os
+import sqlite3
+import time
+from contextlib import closing
+from datetime import datetime
+
+# Local history of weekly DaaS queue summaries used for the slide 6 comparison, kept next
+# to the app rather than in whatever directory Streamlit was started from
+HISTORY_DB_PATH = os.environ.get(
+    "CSM_HISTORY_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "week_history.sqlite3")
+)
+HISTORY_WEEKS = int(os.environ.get("CSM_HISTORY_WEEKS", 4))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS weeks (
+    week_start TEXT PRIMARY KEY,
+    week_label TEXT NOT NULL,
+    period TEXT,
+    total_tickets INTEGER NOT NULL DEFAULT 0,
+    awaiting INTEGER NOT NULL DEFAULT 0,
+    closed INTEGER NOT NULL DEFAULT 0,
+    resolved INTEGER NOT NULL DEFAULT 0,
+    updated_at INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS week_resources (
+    week_start TEXT NOT NULL REFERENCES weeks(week_start) ON DELETE CASCADE,
+    resource TEXT NOT NULL,
+    tickets INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (week_start, resource)
+);
+CREATE INDEX IF NOT EXISTS idx_week_resources_resource ON week_resources(resource, week_start);
+"""
+
+
+def connect(db_path=None):
+    """Open the history database, creating the schema on first use"""
+    conn = sqlite3.connect(db_path or HISTORY_DB_PATH)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def week_label(start_date):
+    """Label used on slide 6, e.g. 'September 1st Week'"""
+    week_of_month = (start_date.day - 1) // 7 + 1
+    suffix = {1: "st", 2: "nd", 3: "rd"}.get(week_of_month, "th")
+    return f"{start_date.strftime('%B')} {week_of_month}{suffix} Week"
+
+
+def parse_week_start(date_info):
+    """Start date of the reporting week from date_info ('start_date' or the 'period' text)"""
+    start_date = date_info.get('start_date')
+    if isinstance(start_date, datetime):
+        return start_date
+    try:
+        return datetime.strptime(date_info['period'].split(' to ')[0].strip(), '%m/%d/%Y')
+    except (KeyError, ValueError, AttributeError):
+        return None
+
+
+def record_week(start_date, period, summary_stats, resource_counts=None, db_path=None):
+    """Insert or replace the summary of one reporting week"""
+    week_start = start_date.strftime('%Y-%m-%d')
+    with closing(connect(db_path)) as conn, conn:
+        conn.execute(
+            """
+            INSERT INTO weeks (week_start, week_label, period, total_tickets, awaiting, closed, resolved, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(week_start) DO UPDATE SET
+                week_label = excluded.week_label,
+                period = excluded.period,
+                total_tickets = excluded.total_tickets,
+                awaiting = excluded.awaiting,
+                closed = excluded.closed,
+                resolved = excluded.resolved,
+                updated_at = excluded.updated_at
+            """,
+            (
+                week_start,
+                week_label(start_date),
+                period,
+                summary_stats.get('total_tickets', 0),
+                summary_stats.get('awaiting', 0),
+                summary_stats.get('closed', 0),
+                summary_stats.get('resolved', 0),
+                int(time.time()),
+            ),
+        )
+        conn.execute("DELETE FROM week_resources WHERE week_start = ?", (week_start,))
+        conn.executemany(
+            "INSERT INTO week_resources (week_start, resource, tickets) VALUES (?, ?, ?)",
+            [(week_start, resource, count) for resource, count in (resource_counts or {}).items()],
+        )
+
+
+def get_recent_weeks(limit=None, before=None, db_path=None):
+    """Last `limit` recorded weeks (oldest first), optionally only weeks starting before `before`"""
+    limit = HISTORY_WEEKS if limit is None else limit
+    query = "SELECT week_start, week_label, total_tickets, awaiting, closed, resolved FROM weeks"
+    params = []
+    if before is not None:
+        query += " WHERE week_start < ?"
+        params.append(before.strftime('%Y-%m-%d'))
+    query += " ORDER BY week_start DESC LIMIT ?"
+    params.append(limit)
+
+    with closing(connect(db_path)) as conn:
+        rows = conn.execute(query, params).fetchall()
+
+    return [
+        {
+            'week_start': week_start,
+            'week_label': label,
+            'total_tickets': total,
+            'awaiting': awaiting,
+            'closed': closed,
+            'resolved': resolved,
+        }
+        for week_start, label, total, awaiting, closed, resolved in reversed(rows)
+    ]
+
+
+def build_slide6_data(start_date, summary_stats, weeks=None, db_path=None):
+    """Slide 6 chart data: the previous recorded weeks followed by the current week"""
+    weeks = HISTORY_WEEKS if weeks is None else weeks
+    history = []
+    if start_date is not None and weeks > 1:
+        history = get_recent_weeks(limit=weeks - 1, before=start_date, db_path=db_path)
+
+    column_chart_data = {}
+    bar_chart_data = {}
+    for week in history:
+        column_chart_data[week['week_label']] = week['total_tickets']
+        bar_chart_data[week['week_label']] = {
+            'awaiting': week['awaiting'],
+            'closed': week['closed'],
+            'resolved': week['resolved'],
+        }
+
+    if start_date is not None and summary_stats is not None:
+        label = week_label(start_date)
+        column_chart_data[label] = summary_stats.get('total_tickets', 0)
+        bar_chart_data[label] = {
+            'awaiting': summary_stats.get('awaiting', 0),
+            'closed': summary_stats.get('closed', 0),
+            'resolved': summary_stats.get('resolved', 0),
+        }
+
+    return {
+        'column_chart_data': column_chart_data,
+        'bar_chart_data': bar_chart_data,
+    }